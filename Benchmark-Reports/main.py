@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+import sys
+import os
+import json
+import time
+import logging
+import argparse
+import resource
+import tempfile
+import importlib.util
+import multiprocessing
+from queue import Empty
+from datetime import datetime
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+sys.path.insert(0, os.path.join(BASE_DIR, 'Common'))
+from fakecloud import FakeCloud, PushgatewayStub, TelegramStub
+
+HISTORY_FILE = '/tmp/bench_history.jsonl'
+
+FORMAT = '%(process)d-%(levelname)s-%(message)s'
+logging.basicConfig(format=FORMAT, level=logging.WARNING)
+LOG = logging.getLogger(__name__)
+
+
+def load_script(folder):
+    """Import <repo>/<folder>/main.py sebagai module tanpa menjalankan blok __main__."""
+    path = os.path.join(BASE_DIR, folder, 'main.py')
+    name = folder.lower().replace('-', '_')
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# =========================
+# Report yang di-benchmark
+# =========================
+def run_orphan_excel(cloud, output_dir):
+    with TelegramStub() as telegram:
+        os.environ['LOG_FILE_PATH'] = os.path.join(output_dir, 'orphan.log')
+        os.environ['TELEGRAM_API_URL'] = telegram.url
+        script = load_script('Orphan-Resource-To-Excel-Send-To-Telegram')
+
+        projectids = script.get_projects_ids(cloud)
+        csv_files = script.collect_orphan_csvs(cloud, projectids, output_dir)
+        output_excel = os.path.join(output_dir, 'Orphan-Resources.xlsx')
+        script.combine_csv_to_excel(csv_files, output_excel)
+        script.send_file_to_telegram(output_excel, 'bench-token', 'bench-chat')
+        return telegram.received_bytes
+
+
+def run_orphan_pushgateway(cloud, output_dir):
+    with PushgatewayStub() as pushgateway:
+        script = load_script('Orphan-Resource-To-PushGateway')
+
+        projectids = script.get_projects_ids(cloud)
+        for ostack_object in script.VALID_OPTIONS:
+            script.push_orphan_metrics(cloud, projectids, ostack_object, pushgateway.url)
+        return pushgateway.received_bytes
+
+
+def run_fip_report(cloud, output_dir):
+    script = load_script('Floating-IP-VM')
+    script.write_fip_report(cloud, os.path.join(output_dir, 'floating_ip_report.csv'))
+    return 0
+
+
+REPORTS = {
+    'orphan-excel': run_orphan_excel,
+    'orphan-pushgateway': run_orphan_pushgateway,
+    'fip': run_fip_report,
+}
+
+
+def _dir_size(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            total += os.path.getsize(os.path.join(root, name))
+    return total
+
+
+def _bench_child(report, cloud_kwargs, queue):
+    """Dijalankan di proses baru (spawn) supaya peak RSS per report tidak tercampur."""
+    try:
+        cloud = FakeCloud(**cloud_kwargs)
+        with tempfile.TemporaryDirectory(prefix=f'bench-{report}-') as output_dir:
+            rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            start = time.perf_counter()
+            sent_bytes = REPORTS[report](cloud, output_dir)
+            wall = time.perf_counter() - start
+            queue.put({
+                'report': report,
+                'wall_time_s': round(wall, 3),
+                'api_calls': sum(cloud.api_calls.values()),
+                'api_calls_by_op': dict(cloud.api_calls.most_common()),
+                'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                'rss_before_kb': rss_before,
+                'output_bytes': _dir_size(output_dir) + sent_bytes,
+            })
+    except Exception as e:
+        LOG.exception(f"Benchmark {report} failed")
+        queue.put({'report': report, 'error': f"{type(e).__name__}: {e}"})
+
+
+def run_benchmark(report, cloud_kwargs):
+    ctx = multiprocessing.get_context('spawn')
+    queue = ctx.Queue()
+    proc = ctx.Process(target=_bench_child, args=(report, cloud_kwargs, queue))
+    proc.start()
+    while True:
+        try:
+            result = queue.get(timeout=1)
+            break
+        except Empty:
+            # Child mati tanpa hasil (mis. OOM kill)
+            if not proc.is_alive():
+                result = {'report': report, 'error': f"process exited with code {proc.exitcode}"}
+                break
+    proc.join()
+    return result
+
+
+def last_result(history_file, report, cloud_kwargs):
+    """Hasil terakhir report yang sama dengan parameter cloud yang sama, untuk perbandingan."""
+    if not os.path.exists(history_file):
+        return None
+    last = None
+    with open(history_file) as f:
+        for line in f:
+            entry = json.loads(line)
+            if entry.get('report') == report and entry.get('cloud') == cloud_kwargs and 'error' not in entry:
+                last = entry
+    return last
+
+
+def _delta(current, previous, key):
+    if not previous or not previous.get(key):
+        return ""
+    return f"({(current[key] - previous[key]) / previous[key] * 100:+.0f}%)"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark report orphan & FIP terhadap cloud sintetis")
+    parser.add_argument("reports", nargs="*", help=f"report yang dijalankan: {', '.join(REPORTS)} (default semua)")
+    parser.add_argument("--scale", type=int, default=10000,
+                        help="jumlah server; resource lain relatif (port = 2x scale)")
+    parser.add_argument("--ports", type=int, help="override jumlah port (maks 1M disarankan)")
+    parser.add_argument("--orphan-ratio", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency-ms", type=float, default=0, help="latency simulasi per API call")
+    parser.add_argument("--history", default=HISTORY_FILE, help="file JSON lines hasil benchmark")
+    args = parser.parse_args()
+    for report in args.reports:
+        if report not in REPORTS:
+            parser.error(f"unknown report {report}, choose from {', '.join(REPORTS)}")
+    args.reports = args.reports or list(REPORTS)
+    return args
+
+
+if __name__ == '__main__':
+    args = parse_args()
+
+    cloud_kwargs = {'scale': args.scale, 'orphan_ratio': args.orphan_ratio, 'seed': args.seed,
+                    'latency_ms': args.latency_ms}
+    if args.ports:
+        cloud_kwargs['counts'] = {'ports': args.ports}
+
+    print(f"{'report':<20} {'wall_s':>14} {'api_calls':>16} {'peak_rss_mb':>16} {'output_kb':>16}")
+    failed = False
+    for report in args.reports:
+        result = run_benchmark(report, cloud_kwargs)
+        if 'error' in result:
+            print(f"{report:<20} ERROR {result['error']}")
+            failed = True
+            continue
+
+        previous = last_result(args.history, report, cloud_kwargs)
+        print(f"{report:<20} "
+              f"{result['wall_time_s']:>7.2f}{_delta(result, previous, 'wall_time_s'):>7} "
+              f"{result['api_calls']:>9}{_delta(result, previous, 'api_calls'):>7} "
+              f"{result['peak_rss_kb'] / 1024:>9.1f}{_delta(result, previous, 'peak_rss_kb'):>7} "
+              f"{result['output_bytes'] / 1024:>9.1f}{_delta(result, previous, 'output_bytes'):>7}")
+
+        result.update({'timestamp': datetime.now().isoformat(timespec='seconds'), 'cloud': cloud_kwargs})
+        with open(args.history, 'a') as f:
+            f.write(json.dumps(result) + "\n")
+
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+import sys
+import io
+import csv
+import socket
+import logging
+import argparse
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import libvirt
+except ImportError:
+    # parse_domain_xml tetap bisa dipakai / dites tanpa libvirt-python
+    libvirt = None
+
+# Default URI per compute, {host} diganti nama compute
+URI_TEMPLATE = 'qemu+ssh://heat-admin@{host}/system'
+OUTPUT_CSV = '/tmp/instance-list.csv'
+MAX_WORKERS = 10
+
+CSV_HEADERS = ['Compute Host', 'Domain', 'UUID', 'Instance Name', 'Project ID', 'Project Name', 'State',
+               'Target', 'Source']
+
+# virDomainState (VIR_DOMAIN_NOSTATE..VIR_DOMAIN_PMSUSPENDED), sama dengan `virsh list --all`
+DOMAIN_STATES = {
+    0: 'no state',
+    1: 'running',
+    2: 'idle',
+    3: 'paused',
+    4: 'in shutdown',
+    5: 'shut off',
+    6: 'crashed',
+    7: 'pmsuspended',
+}
+
+FORMAT = '%(process)d-%(levelname)s-%(message)s'
+logging.basicConfig(format=FORMAT, level=logging.INFO)
+LOG = logging.getLogger(__name__)
+
+
+def _local(tag):
+    # "{namespace}name" -> "name", namespace nova berbeda tiap versi (1.0, 1.1, ...)
+    return tag.rsplit('}', 1)[-1]
+
+
+def parse_domain_xml(xml_desc):
+    """
+    Parse XML domain dengan iterparse (streaming) dan ambil uuid, metadata nova
+    (nama instance, project) dan daftar disk (target, source) seperti `virsh domblklist`.
+    """
+    info = {"uuid": "", "name": "", "project_id": "", "project_name": "", "disks": []}
+    path = []
+    disk = None
+    for event, elem in ET.iterparse(io.BytesIO(xml_desc.encode()), events=("start", "end")):
+        tag = _local(elem.tag)
+        if event == "start":
+            path.append(tag)
+            if path == ["domain", "devices", "disk"]:
+                disk = {"target": "", "source": "-"}
+            continue
+
+        parent = path[-2] if len(path) > 1 else None
+        if path == ["domain", "uuid"]:
+            info["uuid"] = (elem.text or "").strip()
+        elif "metadata" in path and "instance" in path:
+            if tag == "name" and parent == "instance":
+                info["name"] = (elem.text or "").strip()
+            elif tag == "project" and parent == "owner":
+                info["project_id"] = elem.get("uuid", "")
+                info["project_name"] = (elem.text or "").strip()
+        elif disk is not None and parent == "disk":
+            if tag == "target":
+                disk["target"] = elem.get("dev", "")
+            elif tag == "source":
+                disk["source"] = elem.get("file") or elem.get("dev") or elem.get("name") or "-"
+        elif disk is not None and path == ["domain", "devices", "disk"]:
+            info["disks"].append((disk["target"], disk["source"]))
+            disk = None
+
+        path.pop()
+        elem.clear()
+    return info
+
+
+def collect_host(uri, compute_host):
+    """Satu koneksi libvirt per compute, semua domain dibaca dalam satu pass."""
+    rows = []
+    conn = libvirt.openReadOnly(uri)
+    try:
+        for dom in conn.listAllDomains(0):
+            try:
+                name = dom.name()
+                state, _ = dom.state()
+                xml_desc = dom.XMLDesc(0)
+                uuid = dom.UUIDString()
+            except libvirt.libvirtError as e:
+                # Domain dihapus / dimigrasi setelah listAllDomains(), lewati saja
+                if e.get_error_code() == libvirt.VIR_ERR_NO_DOMAIN:
+                    LOG.warning(f"[{compute_host}] domain disappeared during scan, skip: {e}")
+                    continue
+                raise
+            info = parse_domain_xml(xml_desc)
+            for target, source in info["disks"]:
+                rows.append([compute_host, name, info["uuid"] or uuid, info["name"],
+                             info["project_id"], info["project_name"], DOMAIN_STATES.get(state, str(state)),
+                             target, source])
+    finally:
+        conn.close()
+    return rows
+
+
+def collect_all(targets, max_workers=MAX_WORKERS):
+    """targets: list of (compute_host, uri). Return rows gabungan dan host yang gagal."""
+    rows = []
+    failed = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(collect_host, uri, host): host for host, uri in targets}
+        for future in as_completed(futures):
+            host = futures[future]
+            try:
+                host_rows = future.result()
+                LOG.info(f"Collected {len(host_rows)} disks from {host}")
+                rows.extend(host_rows)
+            except Exception as e:
+                # Satu compute bermasalah (libvirt, XML rusak, ...) tidak menghentikan host lain
+                LOG.error(f"Failed to collect from {host}: {type(e).__name__}: {e}")
+                failed.append(host)
+    rows.sort(key=lambda r: (r[0], r[1], r[7]))
+    return rows, failed
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Kumpulkan disk lokal instance dari libvirt compute")
+    parser.add_argument("hosts", nargs="*", help="nama compute host (default: host lokal via --uri)")
+    parser.add_argument("--uri", default="qemu:///system",
+                        help="URI libvirt bila tanpa hosts, mis. test:///default")
+    parser.add_argument("--uri-template", default=URI_TEMPLATE)
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS)
+    parser.add_argument("--output", default=OUTPUT_CSV)
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    if libvirt is None:
+        LOG.error("libvirt-python is required: pip install libvirt-python")
+        sys.exit(1)
+
+    if args.hosts:
+        targets = [(host, args.uri_template.format(host=host)) for host in args.hosts]
+    else:
+        targets = [(socket.gethostname(), args.uri)]
+
+    rows, failed = collect_all(targets, args.workers)
+
+    with open(args.output, "w", newline="") as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+        writer.writerow(CSV_HEADERS)
+        writer.writerows(rows)
+    LOG.info(f"Saved {len(rows)} disks from {len(targets) - len(failed)} compute(s) to {args.output}")
+
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,96 @@
+import os
+import unittest
+import importlib.util
+
+# main.py tiap tool di-load dengan nama unik supaya pytest dari root repo tidak bentrok
+_spec = importlib.util.spec_from_file_location("check_disk_local_instance",
+                                               os.path.join(os.path.dirname(__file__), "main.py"))
+main = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(main)
+collect_host, libvirt, parse_domain_xml = main.collect_host, main.libvirt, main.parse_domain_xml
+
+NOVA_DOMAIN_XML = """
+<domain type='kvm' id='7'>
+  <name>instance-0000002a</name>
+  <uuid>5f1c3b8e-7a52-4c36-9b53-1f0a2d6e8c41</uuid>
+  <metadata>
+    <nova:instance xmlns:nova="http://openstack.org/xmlns/libvirt/nova/1.1">
+      <nova:package version="23.2.2"/>
+      <nova:name>web-01</nova:name>
+      <nova:flavor name="m1.small">
+        <nova:memory>2048</nova:memory>
+      </nova:flavor>
+      <nova:owner>
+        <nova:user uuid="0f9d7c3a5b8e4f21a6c4d2e1b3a59876">alice</nova:user>
+        <nova:project uuid="8a7c6e5d4b3a4f2e9d1c0b9a8e7f6d5c">finance</nova:project>
+      </nova:owner>
+    </nova:instance>
+  </metadata>
+  <devices>
+    <disk type='network' device='disk'>
+      <driver name='qemu' type='raw' cache='writeback'/>
+      <source protocol='rbd' name='vms/5f1c3b8e-7a52-4c36-9b53-1f0a2d6e8c41_disk'>
+        <host name='10.0.0.1' port='6789'/>
+      </source>
+      <target dev='vda' bus='virtio'/>
+    </disk>
+    <disk type='file' device='disk'>
+      <driver name='qemu' type='qcow2'/>
+      <source file='/var/lib/nova/instances/5f1c3b8e-7a52-4c36-9b53-1f0a2d6e8c41/disk.eph0'/>
+      <backingStore type='file'>
+        <format type='raw'/>
+        <source file='/var/lib/nova/instances/_base/ephemeral_1_0706d66'/>
+      </backingStore>
+      <target dev='vdb' bus='virtio'/>
+    </disk>
+    <disk type='file' device='cdrom'>
+      <driver name='qemu' type='raw'/>
+      <target dev='hda' bus='ide'/>
+      <readonly/>
+    </disk>
+    <interface type='bridge'>
+      <source bridge='br-int'/>
+      <target dev='tap1234'/>
+    </interface>
+  </devices>
+</domain>
+"""
+
+
+class ParseDomainXmlTest(unittest.TestCase):
+    def test_nova_metadata_and_disks(self):
+        info = parse_domain_xml(NOVA_DOMAIN_XML)
+        self.assertEqual(info["uuid"], "5f1c3b8e-7a52-4c36-9b53-1f0a2d6e8c41")
+        self.assertEqual(info["name"], "web-01")
+        self.assertEqual(info["project_id"], "8a7c6e5d4b3a4f2e9d1c0b9a8e7f6d5c")
+        self.assertEqual(info["project_name"], "finance")
+        self.assertEqual(info["disks"], [
+            ("vda", "vms/5f1c3b8e-7a52-4c36-9b53-1f0a2d6e8c41_disk"),
+            # source dari backingStore tidak menimpa source disk
+            ("vdb", "/var/lib/nova/instances/5f1c3b8e-7a52-4c36-9b53-1f0a2d6e8c41/disk.eph0"),
+            ("hda", "-"),
+        ])
+
+    def test_domain_without_nova_metadata(self):
+        info = parse_domain_xml("<domain><uuid>u1</uuid><devices/></domain>")
+        self.assertEqual((info["uuid"], info["name"], info["project_id"], info["disks"]), ("u1", "", "", []))
+
+
+@unittest.skipIf(libvirt is None, "libvirt-python not installed")
+class CollectHostTest(unittest.TestCase):
+    def test_test_driver(self):
+        conn = libvirt.openReadOnly("test:///default")
+        try:
+            domains = {dom.name(): parse_domain_xml(dom.XMLDesc(0)) for dom in conn.listAllDomains(0)}
+        finally:
+            conn.close()
+
+        rows = collect_host("test:///default", "test-host")
+        expected = sorted((name, target, source) for name, info in domains.items()
+                          for target, source in info["disks"])
+        self.assertEqual(sorted((r[1], r[7], r[8]) for r in rows), expected)
+        self.assertTrue(all(r[0] == "test-host" and r[2] for r in rows))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+import sys
+import os
+import logging
+import argparse
+from collections import defaultdict
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'Common'))
+from oscloud import connect
+
+# Change with your rc file
+OPENRC_PATH = '/path/to/rcfile'
+
+# File berisi daftar router_id (satu per baris)
+ROUTER_ID_FILE = 'router_id'
+LOG_FILE = '/opt/script/router/hasil_router_check.txt'
+
+ROUTER_INTERFACE_OWNERS = (
+    'network:router_interface',
+    'network:router_interface_distributed',
+    'network:ha_router_replicated_interface',
+)
+
+FORMAT = '%(process)d-%(levelname)s-%(message)s'
+logging.basicConfig(format=FORMAT, level=logging.INFO)
+LOG = logging.getLogger(__name__)
+
+
+def read_router_ids(file_path):
+    with open(file_path) as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def build_port_index(conn):
+    """
+    Satu listing port untuk semua project, dipecah menjadi:
+    - router_subnets: router_id -> [subnet_id, ...] (dari port interface router)
+    - subnet_vm_ports: subnet_id -> [port_id, ...] (dari port compute:*)
+    """
+    router_subnets = defaultdict(list)
+    subnet_vm_ports = defaultdict(list)
+    for port in conn.network.ports():
+        owner = port.device_owner or ""
+        if owner in ROUTER_INTERFACE_OWNERS:
+            for ip in port.fixed_ips or []:
+                if ip["subnet_id"] not in router_subnets[port.device_id]:
+                    router_subnets[port.device_id].append(ip["subnet_id"])
+        elif owner.startswith("compute:"):
+            for ip in port.fixed_ips or []:
+                subnet_vm_ports[ip["subnet_id"]].append(port.id)
+    return router_subnets, subnet_vm_ports
+
+
+def check_routers(conn, router_ids=None):
+    """
+    Return list of dict per router: id, name, status (safe/in_use/no_interface/not_found)
+    dan subnets -> [port_id VM].
+    """
+    routers = {router.id: router.name for router in conn.network.routers()}
+    router_subnets, subnet_vm_ports = build_port_index(conn)
+
+    results = []
+    for rid in (router_ids if router_ids is not None else sorted(routers)):
+        if rid not in routers:
+            results.append({"id": rid, "name": None, "status": "not_found", "subnets": {}})
+            continue
+        subnets = {subnet: subnet_vm_ports.get(subnet, []) for subnet in router_subnets.get(rid, [])}
+        if not subnets:
+            status = "no_interface"
+        elif any(subnets.values()):
+            status = "in_use"
+        else:
+            status = "safe"
+        results.append({"id": rid, "name": routers[rid], "status": status, "subnets": subnets})
+    return results
+
+
+def write_log(results, log_file):
+    with open(log_file, "w") as f:
+        f.write("=== ROUTER CHECK START ===\n")
+        for res in results:
+            f.write(f"🔍 Checking router: {res['id']}\n")
+            if res["status"] == "not_found":
+                f.write("  ⚠️  Router not found!\n")
+                continue
+            if res["status"] == "no_interface":
+                f.write("  ⚠️  No internal interfaces found!\n")
+                continue
+            for subnet, ports in res["subnets"].items():
+                f.write(f"  🌐 Subnet: {subnet}\n")
+                if not ports:
+                    f.write("    ✅ No VM using this subnet — safe to delete (if other conditions met)\n")
+                else:
+                    f.write("    ❌ Subnet in use by VM(s):\n")
+                    for port_id in ports:
+                        f.write(f"      - {port_id}\n")
+            verdict = "✅ SAFE" if res["status"] == "safe" else "❌ IN USE"
+            f.write(f"  {verdict}\n")
+        f.write("=== ROUTER CHECK COMPLETE ===\n")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Cek router yang masih terhubung ke instance")
+    parser.add_argument("--router-file", default=ROUTER_ID_FILE,
+                        help="file berisi router_id (satu per baris)")
+    parser.add_argument("--all", action="store_true", help="cek semua router, abaikan --router-file")
+    parser.add_argument("--log-file", default=LOG_FILE)
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+
+    router_ids = None if args.all else read_router_ids(args.router_file)
+
+    conn = connect(OPENRC_PATH)
+    if not conn:
+        sys.exit(1)
+
+    results = check_routers(conn, router_ids)
+    write_log(results, args.log_file)
+
+    counts = defaultdict(int)
+    for res in results:
+        counts[res["status"]] += 1
+    LOG.info(f"Checked {len(results)} routers: {counts['safe']} safe, {counts['in_use']} in use, "
+             f"{counts['no_interface']} without interface, {counts['not_found']} not found")
+    print(f"✅ Log saved to: {args.log_file}")
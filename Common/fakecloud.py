@@ -0,0 +1,315 @@
+"""
+Cloud sintetis (offline, deterministik) untuk menjalankan report tanpa cloud asli.
+
+    from fakecloud import FakeCloud, PushgatewayStub, TelegramStub
+
+    cloud = FakeCloud(scale=10000, orphan_ratio=0.05)
+    headers, orphans = get_orphan_objs(cloud, get_projects_ids(cloud), "servers")
+    print(cloud.api_calls)
+
+FakeCloud meniru subset openstacksdk yang dipakai script di repo ini lewat ShimCloud
+(sdkshim.py): method cloud layer (list_servers, list_ports, ...) dan proxy
+compute/network/block_storage/image/identity. Resource dibuat on-the-fly dari index, jadi 1M port tidak disimpan di memory kecuali
+caller sendiri yang menyimpannya. Setiap halaman listing (page_size) dan setiap get_*
+dihitung sebagai satu API call di `api_calls`.
+
+PushgatewayStub dan TelegramStub adalah HTTP server lokal yang mencatat request.
+"""
+import time
+import json
+import threading
+from collections import Counter
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from openstack import exceptions as os_exc
+
+from sdkshim import ShimCloud
+
+# Prefix uuid per jenis resource, dipakai untuk get_* (id -> index)
+KINDS = {
+    "domain": 1, "project": 2, "deleted_project": 3, "user": 4, "flavor": 5, "server": 6,
+    "volume": 7, "snapshot": 8, "image": 9, "network": 10, "subnet": 11, "router": 12,
+    "floating_ip": 13, "port": 14, "security_group": 15,
+}
+_KIND_BY_CODE = {code: kind for kind, code in KINDS.items()}
+
+# kind ShimCloud (= key counts) -> (kind resource, operation listing, operation get)
+OPERATIONS = {
+    "domains": ("domain", "GET identity /domains", "GET identity /domains/{id}"),
+    "projects": ("project", "GET identity /projects", "GET identity /projects/{id}"),
+    "users": ("user", "GET identity /users", "GET identity /users/{id}"),
+    "flavors": ("flavor", "GET compute /flavors/detail", "GET compute /flavors/{id}"),
+    "servers": ("server", "GET compute /servers/detail", "GET compute /servers/{id}"),
+    "volumes": ("volume", "GET block-storage /volumes/detail", "GET block-storage /volumes/{id}"),
+    "snapshots": ("snapshot", "GET block-storage /snapshots/detail", "GET block-storage /snapshots/{id}"),
+    "images": ("image", "GET image /images", "GET image /images/{id}"),
+    "networks": ("network", "GET network /networks", "GET network /networks/{id}"),
+    "subnets": ("subnet", "GET network /subnets", "GET network /subnets/{id}"),
+    "routers": ("router", "GET network /routers", "GET network /routers/{id}"),
+    "floating_ips": ("floating_ip", "GET network /floatingips", "GET network /floatingips/{id}"),
+    "ports": ("port", "GET network /ports", "GET network /ports/{id}"),
+    "security_groups": ("security_group", "GET network /security-groups", "GET network /security-groups/{id}"),
+}
+_MASK = 0xffffffff
+
+COMPUTE_HOSTS = 20
+CINDER_POOLS = ("tripleo_ceph#volumes", "tripleo_ceph#volumes-ssd", "tripleo_iscsi#iscsi")
+
+
+def make_id(kind, index):
+    return f"{KINDS[kind]:08x}-0000-4000-8000-{index:012x}"
+
+
+def parse_id(resource_id):
+    """Kebalikan make_id, return (kind, index) atau (None, None)."""
+    try:
+        code, _, _, _, index = resource_id.split("-")
+        return _KIND_BY_CODE.get(int(code, 16)), int(index, 16)
+    except (AttributeError, ValueError):
+        return None, None
+
+
+def default_counts(scale):
+    """Jumlah resource relatif terhadap scale (scale=500000 -> 1M port)."""
+    networks = max(scale // 20, 1)
+    return {
+        "domains": 2,
+        "projects": max(scale // 50, 1),
+        "users": max(scale // 20, 1),
+        "flavors": 10,
+        "servers": scale,
+        "ports": 2 * scale,
+        "volumes": scale,
+        "snapshots": max(scale // 2, 1),
+        "images": max(scale // 10, 1),
+        "networks": networks,
+        "subnets": networks,
+        "routers": max(networks // 2, 1),
+        "floating_ips": max(scale // 4, 1),
+        "security_groups": max(scale // 10, 1),
+    }
+
+
+class FakeResource(dict):
+    """Resource yang bisa diakses sebagai atribut (SDK proxy) maupun dict (cloud layer)."""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+
+class FakeCloud(ShimCloud):
+    def __init__(self, scale=1000, orphan_ratio=0.05, seed=0, counts=None, page_size=1000, latency_ms=0):
+        self.counts = default_counts(scale)
+        self.counts.update(counts or {})
+        self.orphan_ratio = orphan_ratio
+        self.seed = seed
+        self.page_size = page_size
+        self.latency = latency_ms / 1000.0
+        self.api_calls = Counter()
+        self._lock = threading.Lock()
+        super().__init__()
+
+    # ----- helper -----
+    def _call(self, operation):
+        with self._lock:
+            self.api_calls[operation] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _hash(self, kind, index):
+        x = (index + self.seed * 0x9E3779B9 + (KINDS[kind] << 20)) & _MASK
+        x = ((x ^ (x >> 16)) * 0x45d9f3b) & _MASK
+        x = ((x ^ (x >> 16)) * 0x45d9f3b) & _MASK
+        return (x ^ (x >> 16)) / float(_MASK + 1)
+
+    def is_orphan(self, kind, index):
+        return self._hash(kind, index) < self.orphan_ratio
+
+    def project_of(self, kind, index):
+        if self.is_orphan(kind, index):
+            return make_id("deleted_project", index)
+        return make_id("project", index % self.counts["projects"])
+
+    # ----- backend ShimCloud -----
+    def rows(self, kind, **filters):
+        """Listing berhalaman: satu API call per page_size resource."""
+        resource_kind, operation, _ = OPERATIONS[kind]
+        n = self.counts[kind]
+        if n == 0:
+            self._call(operation)
+        for i in range(n):
+            if i % self.page_size == 0:
+                self._call(operation)
+            res = self.build(resource_kind, i)
+            if all(res.get(k) == v for k, v in filters.items()):
+                yield res
+
+    def get(self, kind, resource_id):
+        resource_kind, _, operation = OPERATIONS[kind]
+        self._call(operation)
+        got_kind, index = parse_id(resource_id)
+        if got_kind != resource_kind or index >= self.counts[kind]:
+            raise os_exc.NotFoundException(f"{resource_kind} {resource_id} could not be found")
+        return self.build(resource_kind, index)
+
+    def authorize(self):
+        self._call("POST identity /v3/auth/tokens")
+
+    # ----- resource factory -----
+    def build(self, kind, i):
+        c = self.counts
+        rid = make_id(kind, i)
+        if kind == "domain":
+            return FakeResource(id=rid, name="Default" if i == 0 else f"domain-{i}")
+        if kind == "project":
+            return FakeResource(id=rid, name=f"project-{i}", domain_id=make_id("domain", i % c["domains"]))
+        if kind == "user":
+            return FakeResource(id=rid, name=f"user-{i}", domain_id=make_id("domain", i % c["domains"]))
+        if kind == "flavor":
+            return FakeResource(id=rid, name=f"m1.flavor-{i}", ram=1024 * (i + 1), vcpus=i + 1, disk=20)
+
+        project_id = self.project_of(kind, i)
+        common = {"id": rid, "project_id": project_id, "tenant_id": project_id}
+        if kind == "server":
+            net = i % c["networks"]
+            flavor = i % c["flavors"]
+            return FakeResource(
+                common, name=f"vm-{i}", user_id=make_id("user", i % c["users"]), status="ACTIVE",
+                power_state=1, compute_host=f"compute-{i % COMPUTE_HOSTS}",
+                hypervisor_hostname=f"compute-{i % COMPUTE_HOSTS}.localdomain",
+                instance_name=f"instance-{i:08x}",
+                flavor={"id": make_id("flavor", flavor), "original_name": f"m1.flavor-{flavor}"},
+                addresses={f"net-{net}": [{"addr": f"10.{net % 256}.{i // 256 % 256}.{i % 256}",
+                                           "version": 4}]},
+                security_groups=[{"name": f"sg-{i % c['security_groups']}"}],
+            )
+        if kind == "port":
+            return self._build_port(i, common)
+        if kind == "volume":
+            attached = i < c["servers"] and i % 2 == 0
+            return FakeResource(
+                common, name=f"volume-{i}", status="in-use" if attached else "available", size=10 + i % 90,
+                volume_type="ceph", migration_status=None, host=f"hostgroup@{CINDER_POOLS[i % len(CINDER_POOLS)]}",
+                attachments=[{"server_id": make_id("server", i)}] if attached else [],
+                volume_image_metadata={"image_id": make_id("image", i % c["images"]),
+                                       "image_name": f"image-{i % c['images']}"} if i % 3 == 0 else {},
+            )
+        if kind == "snapshot":
+            return FakeResource(common, name=f"snapshot-{i}", status="available", size=10 + i % 90,
+                                volume_id=make_id("volume", i % c["volumes"]))
+        if kind == "image":
+            return FakeResource(common, name=f"image-{i}", owner_id=project_id, status="active",
+                                size=0 if i % 5 == 0 else 1 << 30)
+        if kind == "network":
+            return FakeResource(common, name=f"net-{i}", status="ACTIVE", subnets=[make_id("subnet", i)])
+        if kind == "subnet":
+            return FakeResource(common, name=f"subnet-{i}", network_id=make_id("network", i % c["networks"]),
+                                cidr=f"10.{i % 256}.0.0/16")
+        if kind == "router":
+            return FakeResource(common, name=f"router-{i}", status="ACTIVE")
+        if kind == "floating_ip":
+            port_id = make_id("port", i % c["servers"]) if i % 3 and c["servers"] else None
+            return FakeResource(common, name="", floating_ip_address=f"172.{16 + i // 65536 % 16}.{i // 256 % 256}.{i % 256}",
+                                status="ACTIVE" if port_id else "DOWN", port_id=port_id)
+        if kind == "security_group":
+            return FakeResource(common, name=f"sg-{i}", description="")
+        raise ValueError(f"unknown kind {kind}")
+
+    def _build_port(self, i, common):
+        """Port [0, servers) = port VM, lalu interface router, sisanya port DHCP."""
+        c = self.counts
+        if i < c["servers"]:
+            subnet = i % c["subnets"]
+            owner, device_id = "compute:nova", make_id("server", i)
+            sgs = [make_id("security_group", i % c["security_groups"])]
+        elif i < c["servers"] + c["routers"]:
+            subnet = (i - c["servers"]) % c["subnets"]
+            owner, device_id, sgs = "network:router_interface", make_id("router", i - c["servers"]), []
+        else:
+            subnet = i % c["subnets"]
+            owner, device_id, sgs = "network:dhcp", f"dhcp-{subnet}", []
+        return FakeResource(
+            common, name="", status="ACTIVE", device_owner=owner, device_id=device_id,
+            network_id=make_id("network", subnet % c["networks"]),
+            fixed_ips=[{"subnet_id": make_id("subnet", subnet), "ip_address": f"10.{subnet % 256}.{i // 256 % 256}.{i % 256}"}],
+            security_group_ids=sgs,
+        )
+
+
+# =========================
+# Stub HTTP lokal
+# =========================
+class StubServer:
+    """HTTP server lokal di thread terpisah yang mencatat (method, path, bytes) setiap request."""
+
+    def __init__(self):
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _handle(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                stub.requests.append((self.command, self.path, len(body)))
+                status, payload = stub.respond(self.command, self.path, body)
+                data = json.dumps(payload).encode() if payload is not None else b""
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    @property
+    def received_bytes(self):
+        return sum(size for _, _, size in self.requests)
+
+    def respond(self, method, path, body):
+        return 404, {"error": "not found"}
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class PushgatewayStub(StubServer):
+    """Pengganti Pushgateway: /metrics/job/<job> menerima POST/PUT/DELETE."""
+
+    def respond(self, method, path, body):
+        if not path.startswith("/metrics/job/"):
+            return 404, None
+        return (202 if method == "DELETE" else 200), None
+
+
+class TelegramStub(StubServer):
+    """Pengganti Telegram Bot API: /bot<token>/sendDocument dan /bot<token>/sendMessage."""
+
+    def respond(self, method, path, body):
+        if method == "POST" and path.startswith("/bot") and path.rsplit("/", 1)[-1] in ("sendDocument", "sendMessage"):
+            return 200, {"ok": True, "result": {"message_id": len(self.requests)}}
+        return 404, {"ok": False, "description": "Not Found"}
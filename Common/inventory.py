@@ -0,0 +1,344 @@
+"""
+Snapshot inventory kolumnar (Arrow IPC, memory-mapped) yang dipakai bersama semua report.
+
+Collector (lihat Inventory-Snapshot/main.py) menulis satu snapshot per region:
+
+    <base>/<region>/<YYYYmmddTHHMMSS>/manifest.json
+    <base>/<region>/<YYYYmmddTHHMMSS>/<kind>.arrow      (servers, ports, volumes, ...)
+
+Hanya field yang dipakai report yang disimpan. Report bisa jalan terhadap snapshot
+alih-alih API dengan env OS_INVENTORY_SNAPSHOT (dir region -> snapshot terbaru, atau dir
+snapshot tertentu); oscloud.connect() akan mengembalikan SnapshotCloud, yaitu ShimCloud
+(sdkshim.py) dengan Snapshot sebagai backend.
+
+Analisis kolumnar langsung (zero-copy):
+
+    snap = open_snapshot("/var/lib/os-inventory/RegionOne")
+    ports = snap.table("ports")          # pyarrow.Table di atas file mmap
+"""
+import os
+import json
+import time
+import shutil
+from datetime import datetime
+
+import pyarrow as pa
+
+from openstack import exceptions as os_exc
+
+from sdkshim import ShimCloud
+
+SNAPSHOT_PATH = os.getenv("OS_INVENTORY_SNAPSHOT")
+BATCH_ROWS = 10000
+PARTIAL_SUFFIX = ".partial"
+# Dir .partial lebih tua dari ini dianggap sisa collector yang mati (bukan yang sedang jalan)
+STALE_PARTIAL_SEC = 6 * 3600
+
+STR = pa.string()
+INT = pa.int64()
+LIST = pa.list_(pa.string())
+
+
+def _attr(name):
+    return lambda obj: getattr(obj, name, None)
+
+
+def _names(items, key="name"):
+    return [item.get(key) for item in items or [] if item.get(key)]
+
+
+# kind -> (listing, [(kolom, tipe arrow, extractor)])
+SCHEMAS = {
+    "domains": (lambda conn: conn.identity.domains(), [
+        ("id", STR, _attr("id")),
+        ("name", STR, _attr("name")),
+    ]),
+    "projects": (lambda conn: conn.identity.projects(), [
+        ("id", STR, _attr("id")),
+        ("name", STR, _attr("name")),
+        ("domain_id", STR, _attr("domain_id")),
+    ]),
+    "users": (lambda conn: conn.identity.users(), [
+        ("id", STR, _attr("id")),
+        ("name", STR, _attr("name")),
+        ("domain_id", STR, _attr("domain_id")),
+    ]),
+    # string 'None' agar flavor private ikut, is_public=None dibuang dari query
+    "flavors": (lambda conn: conn.compute.flavors(is_public='None'), [
+        ("id", STR, _attr("id")),
+        ("name", STR, _attr("name")),
+        ("ram", INT, _attr("ram")),
+        ("vcpus", INT, _attr("vcpus")),
+    ]),
+    "servers": (lambda conn: conn.compute.servers(details=True, all_projects=True), [
+        ("id", STR, _attr("id")),
+        ("name", STR, _attr("name")),
+        ("project_id", STR, _attr("project_id")),
+        ("user_id", STR, _attr("user_id")),
+        ("status", STR, _attr("status")),
+        ("power_state", INT, _attr("power_state")),
+        ("compute_host", STR, _attr("compute_host")),
+        ("instance_name", STR, _attr("instance_name")),
+        ("flavor_id", STR, lambda s: (s.flavor or {}).get("id")),
+        ("flavor_name", STR, lambda s: (s.flavor or {}).get("original_name") or (s.flavor or {}).get("name")),
+        ("network_names", LIST, lambda s: list((s.addresses or {}).keys())),
+        ("security_group_names", LIST, lambda s: _names(s.security_groups)),
+    ]),
+    "volumes": (lambda conn: conn.block_storage.volumes(details=True, all_projects=True), [
+        ("id", STR, _attr("id")),
+        ("name", STR, _attr("name")),
+        ("project_id", STR, _attr("project_id")),
+        ("status", STR, _attr("status")),
+        ("size", INT, _attr("size")),
+        ("volume_type", STR, _attr("volume_type")),
+        ("migration_status", STR, _attr("migration_status")),
+        ("host", STR, _attr("host")),
+        ("server_ids", LIST, lambda v: _names(v.attachments, "server_id")),
+        ("image_id", STR, lambda v: (v.volume_image_metadata or {}).get("image_id")),
+        ("image_name", STR, lambda v: (v.volume_image_metadata or {}).get("image_name")),
+    ]),
+    "snapshots": (lambda conn: conn.block_storage.snapshots(details=True, all_projects=True), [
+        ("id", STR, _attr("id")),
+        ("name", STR, _attr("name")),
+        ("project_id", STR, _attr("project_id")),
+        ("status", STR, _attr("status")),
+        ("size", INT, _attr("size")),
+        ("volume_id", STR, _attr("volume_id")),
+    ]),
+    "images": (lambda conn: conn.image.images(), [
+        ("id", STR, _attr("id")),
+        ("name", STR, _attr("name")),
+        ("owner_id", STR, lambda i: getattr(i, "owner_id", None) or getattr(i, "project_id", None)),
+        ("status", STR, _attr("status")),
+        ("size", INT, _attr("size")),
+    ]),
+    "networks": (lambda conn: conn.network.networks(), [
+        ("id", STR, _attr("id")),
+        ("name", STR, _attr("name")),
+        ("project_id", STR, _attr("project_id")),
+        ("subnets", LIST, lambda n: list(getattr(n, "subnet_ids", None) or getattr(n, "subnets", None) or [])),
+    ]),
+    "subnets": (lambda conn: conn.network.subnets(), [
+        ("id", STR, _attr("id")),
+        ("name", STR, _attr("name")),
+        ("project_id", STR, _attr("project_id")),
+        ("network_id", STR, _attr("network_id")),
+        ("cidr", STR, _attr("cidr")),
+    ]),
+    "routers": (lambda conn: conn.network.routers(), [
+        ("id", STR, _attr("id")),
+        ("name", STR, _attr("name")),
+        ("project_id", STR, _attr("project_id")),
+        ("status", STR, _attr("status")),
+    ]),
+    "floating_ips": (lambda conn: conn.network.ips(), [
+        ("id", STR, _attr("id")),
+        ("name", STR, _attr("name")),
+        ("floating_ip_address", STR, _attr("floating_ip_address")),
+        ("project_id", STR, _attr("project_id")),
+        ("status", STR, _attr("status")),
+        ("port_id", STR, _attr("port_id")),
+    ]),
+    "ports": (lambda conn: conn.network.ports(), [
+        ("id", STR, _attr("id")),
+        ("name", STR, _attr("name")),
+        ("project_id", STR, _attr("project_id")),
+        ("device_owner", STR, _attr("device_owner")),
+        ("device_id", STR, _attr("device_id")),
+        ("fixed_subnet_ids", LIST, lambda p: _names(p.fixed_ips, "subnet_id")),
+        ("fixed_ip_addresses", LIST, lambda p: _names(p.fixed_ips, "ip_address")),
+        ("security_group_ids", LIST, lambda p: list(p.security_group_ids or [])),
+    ]),
+    "security_groups": (lambda conn: conn.network.security_groups(), [
+        ("id", STR, _attr("id")),
+        ("name", STR, _attr("name")),
+        ("project_id", STR, _attr("project_id")),
+    ]),
+}
+
+
+# =========================
+# Writer
+# =========================
+def _schema(kind):
+    return pa.schema([(name, typ) for name, typ, _ in SCHEMAS[kind][1]])
+
+
+def write_table(conn, kind, path, batch_rows=BATCH_ROWS):
+    """Stream listing ke file Arrow IPC per batch, memory tetap kecil. Return jumlah row."""
+    listing, fields = SCHEMAS[kind]
+    schema = _schema(kind)
+    rows = 0
+    with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, schema) as writer:
+        columns = [[] for _ in fields]
+        for obj in listing(conn):
+            for col, (_, _, extract) in zip(columns, fields):
+                col.append(extract(obj))
+            rows += 1
+            if len(columns[0]) >= batch_rows:
+                writer.write_batch(pa.record_batch(columns, schema=schema))
+                columns = [[] for _ in fields]
+        if columns[0] or rows == 0:
+            writer.write_batch(pa.record_batch(columns, schema=schema))
+    return rows
+
+
+def collect(conn, base_dir, region, kinds=None):
+    """Tulis snapshot baru untuk satu region, return path snapshot. Ditulis ke dir sementara lalu rename."""
+    timestamp = datetime.now().strftime("%Y%m%dT%H%M%S")
+    region_dir = os.path.join(base_dir, region)
+    final_dir = os.path.join(region_dir, timestamp)
+    tmp_dir = final_dir + PARTIAL_SUFFIX
+    os.makedirs(tmp_dir, exist_ok=True)
+    try:
+        counts = {}
+        for kind in kinds or SCHEMAS:
+            counts[kind] = write_table(conn, kind, os.path.join(tmp_dir, f"{kind}.arrow"))
+        manifest = {
+            "region": region,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "counts": counts,
+            "fields": {kind: [name for name, _, _ in SCHEMAS[kind][1]] for kind in counts},
+        }
+        with open(os.path.join(tmp_dir, "manifest.json"), "w") as f:
+            json.dump(manifest, f, indent=1)
+        os.rename(tmp_dir, final_dir)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    return final_dir
+
+
+def prune(base_dir, region, keep):
+    """
+    Hapus snapshot lama, sisakan `keep` snapshot lengkap terbaru. Snapshot sebagian
+    (--kinds) tidak dihitung, dan ikut dihapus bila lebih tua dari snapshot lengkap tertua
+    yang disimpan. Dir .partial sisa collector yang mati ikut dibersihkan.
+    """
+    region_dir = os.path.join(base_dir, region)
+    remove_stale_partials(region_dir)
+    snapshots = list_snapshots(region_dir)
+    complete = [path for path in snapshots if is_complete(path)]
+    kept = complete[-keep:] if keep > 0 else []
+    for path in snapshots:
+        if path in kept:
+            continue
+        if path in complete or (kept and path < kept[0]):
+            shutil.rmtree(path)
+
+
+def remove_stale_partials(region_dir, max_age=STALE_PARTIAL_SEC):
+    """Hapus dir <ts>.partial yang tidak berubah selama max_age (collector di-kill / crash)."""
+    if not os.path.isdir(region_dir):
+        return
+    now = time.time()
+    for name in os.listdir(region_dir):
+        path = os.path.join(region_dir, name)
+        if name.endswith(PARTIAL_SUFFIX) and now - os.path.getmtime(path) > max_age:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+# =========================
+# Reader
+# =========================
+def list_snapshots(region_dir):
+    """Snapshot yang sudah di-rename (bukan .partial) dan punya manifest, urut dari yang terlama."""
+    if not os.path.isdir(region_dir):
+        return []
+    return sorted(os.path.join(region_dir, name) for name in os.listdir(region_dir)
+                  if not name.endswith(PARTIAL_SUFFIX)
+                  and os.path.exists(os.path.join(region_dir, name, "manifest.json")))
+
+
+def read_manifest(path):
+    with open(os.path.join(path, "manifest.json")) as f:
+        return json.load(f)
+
+
+def is_complete(path):
+    """Snapshot lengkap = manifest berisi semua kind di SCHEMAS (bukan hasil --kinds)."""
+    return set(SCHEMAS) <= set(read_manifest(path).get("counts", {}))
+
+
+def resolve_snapshot(path):
+    """Dir snapshot dikembalikan apa adanya, dir region -> snapshot lengkap terbaru."""
+    if os.path.exists(os.path.join(path, "manifest.json")):
+        return path
+    snapshots = [snap for snap in list_snapshots(path) if is_complete(snap)]
+    if not snapshots:
+        raise FileNotFoundError(f"no complete inventory snapshot found in {path}")
+    return snapshots[-1]
+
+
+class _Row(dict):
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+
+def _restore(kind, row):
+    """Bentuk ulang field compound agar sama dengan objek SDK / cloud layer."""
+    if "project_id" in row:
+        row["tenant_id"] = row["project_id"]
+    if kind == "servers":
+        row["flavor"] = {"id": row["flavor_id"], "original_name": row["flavor_name"]}
+        row["addresses"] = {name: [] for name in row["network_names"] or []}
+        row["security_groups"] = [{"name": name} for name in row["security_group_names"] or []]
+    elif kind == "volumes":
+        row["attachments"] = [{"server_id": sid} for sid in row["server_ids"] or []]
+        row["volume_image_metadata"] = ({"image_id": row["image_id"], "image_name": row["image_name"]}
+                                        if row["image_id"] else {})
+    elif kind == "ports":
+        row["fixed_ips"] = [{"subnet_id": sid, "ip_address": ip}
+                            for sid, ip in zip(row["fixed_subnet_ids"] or [], row["fixed_ip_addresses"] or [])]
+    return _Row(row)
+
+
+class Snapshot:
+    def __init__(self, path):
+        self.path = resolve_snapshot(path)
+        self.manifest = read_manifest(self.path)
+        self._tables = {}
+        self._by_id = {}
+
+    def table(self, kind):
+        """pyarrow.Table zero-copy di atas file yang di-mmap."""
+        if kind not in self._tables:
+            source = pa.memory_map(os.path.join(self.path, f"{kind}.arrow"), "r")
+            self._tables[kind] = pa.ipc.open_file(source).read_all()
+        return self._tables[kind]
+
+    def rows(self, kind, **filters):
+        for batch in self.table(kind).to_batches():
+            for row in batch.to_pylist():
+                if all(row.get(k) == v for k, v in filters.items()):
+                    yield _restore(kind, row)
+
+    def get(self, kind, resource_id):
+        if kind not in self._by_id:
+            self._by_id[kind] = {rid: i for i, rid in enumerate(self.table(kind).column("id").to_pylist())}
+        index = self._by_id[kind].get(resource_id)
+        if index is None:
+            raise os_exc.NotFoundException(f"{kind} {resource_id} could not be found in snapshot {self.path}")
+        return _restore(kind, self.table(kind).slice(index, 1).to_pylist()[0])
+
+
+class SnapshotCloud(ShimCloud):
+    """Pengganti koneksi openstacksdk (read-only) yang membaca dari Snapshot."""
+
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+        super().__init__()
+
+    def rows(self, kind, **filters):
+        return self.snapshot.rows(kind, **filters)
+
+    def get(self, kind, resource_id):
+        return self.snapshot.get(kind, resource_id)
+
+
+def open_snapshot(path=None):
+    """SnapshotCloud dari path (default env OS_INVENTORY_SNAPSHOT)."""
+    return SnapshotCloud(Snapshot(path or SNAPSHOT_PATH))
@@ -0,0 +1,72 @@
+"""
+Helper koneksi bersama untuk semua script: load openrc, buat koneksi openstacksdk dengan
+tracer + throttle terpasang, atau inventory snapshot bila OS_INVENTORY_SNAPSHOT di-set.
+
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'Common'))
+    from oscloud import connect
+
+    conn = connect(OPENRC_PATH)
+    if not conn:
+        sys.exit(1)
+
+Dengan snapshot, openrc tidak dibaca sama sekali: report bisa jalan di host tanpa credential.
+"""
+import os
+import logging
+
+import openstack
+
+import throttle
+import tracer
+
+LOG = logging.getLogger(__name__)
+
+
+def load_openrc(file_path):
+    """Load OpenStack RC file like `source` does in shell."""
+    with open(file_path) as f:
+        for line in f:
+            if line.strip().startswith("#") or not line.strip():
+                continue
+            if line.startswith("export"):
+                key_value = line.strip().split("export ")[1]
+                key, val = key_value.split("=", 1)
+                val = val.strip('"').strip("'")
+                os.environ[key.strip()] = val.strip()
+
+
+def instrument(conn):
+    """Tracing opt-in (OS_TRACE_FILE), retry 429/503 + adaptive concurrency per service."""
+    tracer.install(conn)
+    throttle.install(conn)
+    return conn
+
+
+def connect_api(region=None):
+    """Koneksi API dari env openrc. Return None (error sudah di-log) bila gagal."""
+    try:
+        # openstack.connect() membaca env OS_* / clouds.yaml seperti os_client_config.get_config(),
+        # tanpa dependency os-client-config
+        conn = instrument(openstack.connect(region_name=region))
+        conn.authorize()
+        return conn
+    except Exception as e:
+        LOG.exception('Connection error: %s', e, exc_info=True)
+
+
+def use_snapshot():
+    return bool(os.getenv('OS_INVENTORY_SNAPSHOT'))
+
+
+def connect(openrc=None, region=None):
+    """
+    Seperti connect_api() setelah load openrc, tapi report dibaca dari inventory snapshot
+    (tanpa openrc) bila OS_INVENTORY_SNAPSHOT di-set.
+    """
+    if use_snapshot():
+        # Import lazy: pyarrow hanya dibutuhkan saat memakai snapshot
+        import inventory
+        return inventory.open_snapshot()
+    if openrc:
+        load_openrc(openrc)
+    return connect_api(region)
@@ -0,0 +1,124 @@
+"""
+Pengganti koneksi openstacksdk read-only: subset cloud layer (list_servers, list_ports, ...)
+dan proxy compute/network/block_storage/image/identity yang dipakai script di repo ini.
+
+Dipakai bersama oleh FakeCloud (fakecloud.py) dan SnapshotCloud (inventory.py) supaya
+keduanya selalu meniru API yang sama. Subclass cukup menyediakan backend:
+
+    rows(kind, **filters)    -> iterable resource, kind = "servers", "ports", "floating_ips", ...
+    get(kind, resource_id)   -> satu resource, raise openstack NotFoundException bila tidak ada
+
+Resource harus bisa diakses sebagai atribut (proxy) maupun dict (cloud layer).
+"""
+
+
+class ShimCloud:
+    def __init__(self):
+        self.compute = _Compute(self)
+        self.network = _Network(self)
+        self.block_storage = _BlockStorage(self)
+        self.image = _Image(self)
+        self.identity = _Identity(self)
+
+    def rows(self, kind, **filters):
+        raise NotImplementedError
+
+    def get(self, kind, resource_id):
+        raise NotImplementedError
+
+    def authorize(self):
+        pass
+
+    # ----- cloud layer (shade-style), return list seperti SDK -----
+    def list_servers(self, all_projects=False, **kwargs):
+        return list(self.rows("servers"))
+
+    def list_networks(self, **kwargs):
+        return list(self.rows("networks"))
+
+    def list_subnets(self, **kwargs):
+        return list(self.rows("subnets"))
+
+    def list_routers(self, **kwargs):
+        return list(self.rows("routers"))
+
+    def list_floating_ips(self, **kwargs):
+        return list(self.rows("floating_ips"))
+
+    def list_ports(self, **kwargs):
+        return list(self.rows("ports", **kwargs))
+
+    def list_security_groups(self, **kwargs):
+        return list(self.rows("security_groups"))
+
+
+class _Proxy:
+    def __init__(self, cloud):
+        self._cloud = cloud
+
+
+class _Compute(_Proxy):
+    def servers(self, details=True, all_projects=False, **filters):
+        return self._cloud.rows("servers", **filters)
+
+    def get_server(self, server_id):
+        return self._cloud.get("servers", server_id)
+
+    def flavors(self, **kwargs):
+        return self._cloud.rows("flavors")
+
+    def get_flavor(self, flavor_id):
+        return self._cloud.get("flavors", flavor_id)
+
+
+class _Network(_Proxy):
+    def ports(self, **filters):
+        return self._cloud.rows("ports", **filters)
+
+    def get_port(self, port_id):
+        return self._cloud.get("ports", port_id)
+
+    def networks(self, **filters):
+        return self._cloud.rows("networks", **filters)
+
+    def subnets(self, **filters):
+        return self._cloud.rows("subnets", **filters)
+
+    def routers(self, **filters):
+        return self._cloud.rows("routers", **filters)
+
+    def ips(self, **filters):
+        return self._cloud.rows("floating_ips", **filters)
+
+    def security_groups(self, **filters):
+        return self._cloud.rows("security_groups", **filters)
+
+
+class _BlockStorage(_Proxy):
+    def volumes(self, details=True, all_projects=False, **filters):
+        return self._cloud.rows("volumes", **filters)
+
+    def snapshots(self, details=True, all_projects=False, **filters):
+        return self._cloud.rows("snapshots", **filters)
+
+
+class _Image(_Proxy):
+    def images(self, **filters):
+        return self._cloud.rows("images", **filters)
+
+
+class _Identity(_Proxy):
+    def projects(self, **filters):
+        return self._cloud.rows("projects", **filters)
+
+    def get_project(self, project_id):
+        return self._cloud.get("projects", project_id)
+
+    def users(self, **filters):
+        return self._cloud.rows("users", **filters)
+
+    def get_user(self, user_id):
+        return self._cloud.get("users", user_id)
+
+    def domains(self, **filters):
+        return self._cloud.rows("domains", **filters)
@@ -0,0 +1,202 @@
+"""
+Adaptive rate limiter + retry untuk semua script yang memanggil OpenStack API.
+
+Pakai dengan membungkus session keystoneauth milik koneksi openstacksdk:
+
+    import throttle
+    conn = openstack.connection.Connection(config=config)
+    throttle.install(conn)
+
+Setiap service (compute, network, identity, ...) punya limit concurrency sendiri yang
+naik pelan-pelan selama latency stabil dan turun setengah saat API membalas 429/503
+atau latency melonjak (AIMD). Baseline latency disimpan per method + URL template, jadi
+listing berhalaman yang memang lambat tidak dibandingkan dengan GET satu resource.
+
+Request yang kena 429/502/503/504 atau gagal konek / timeout di-retry dengan exponential
+backoff + jitter, dan header Retry-After selalu dihormati. Error koneksi lain (SSL,
+sertifikat, ...) tidak akan sembuh dengan retry, jadi langsung di-raise.
+"""
+import os
+import time
+import random
+import logging
+import threading
+from email.utils import parsedate_to_datetime
+
+from keystoneauth1 import exceptions as ks_exc
+
+from tracer import service_type, url_template
+
+MIN_CONCURRENCY = int(os.getenv("OS_THROTTLE_MIN_CONCURRENCY", "1"))
+MAX_CONCURRENCY = int(os.getenv("OS_THROTTLE_MAX_CONCURRENCY", "32"))
+INITIAL_CONCURRENCY = int(os.getenv("OS_THROTTLE_INITIAL_CONCURRENCY", "4"))
+# Latency dianggap "lambat" bila melebihi baseline * LATENCY_TOLERANCE
+LATENCY_TOLERANCE = float(os.getenv("OS_THROTTLE_LATENCY_TOLERANCE", "2.0"))
+MAX_RETRIES = int(os.getenv("OS_THROTTLE_MAX_RETRIES", "6"))
+BACKOFF_BASE_SEC = float(os.getenv("OS_THROTTLE_BACKOFF_BASE_SEC", "0.5"))
+BACKOFF_MAX_SEC = float(os.getenv("OS_THROTTLE_BACKOFF_MAX_SEC", "60"))
+
+# Status yang menandakan control plane kewalahan (request ditolak), limit langsung dipotong
+OVERLOAD_STATUS = (429, 503)
+# 502/504 bisa terjadi setelah request diproses, jadi hanya di-retry untuk method idempotent
+GATEWAY_STATUS = (502, 504)
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+LOG = logging.getLogger(__name__)
+
+
+class AdaptiveLimiter:
+    """Limit concurrency satu service dengan AIMD berbasis latency dan error."""
+
+    def __init__(self, name, initial=INITIAL_CONCURRENCY, minimum=MIN_CONCURRENCY,
+                 maximum=MAX_CONCURRENCY, tolerance=LATENCY_TOLERANCE):
+        self.name = name
+        self.limit = float(max(minimum, min(initial, maximum)))
+        self.minimum = minimum
+        self.maximum = maximum
+        self.tolerance = tolerance
+        self.in_flight = 0
+        # (method, url template) -> latency baseline
+        self.baselines = {}
+        self.paused_until = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            while True:
+                wait = self.paused_until - time.monotonic()
+                if wait > 0:
+                    self._cond.wait(wait)
+                    continue
+                if self.in_flight < int(self.limit):
+                    self.in_flight += 1
+                    return
+                self._cond.wait()
+
+    def release(self, latency=None, overloaded=False, key=None):
+        with self._cond:
+            self.in_flight -= 1
+            if overloaded:
+                self.limit = max(self.minimum, self.limit / 2)
+                LOG.info(f"[throttle] {self.name} overloaded, concurrency -> {int(self.limit)}")
+            elif latency is not None:
+                self._observe(latency, key)
+            self._cond.notify_all()
+
+    def _observe(self, latency, key=None):
+        # Baseline per endpoint = latency terendah yang pernah terlihat, pelan-pelan naik agar
+        # bisa menyesuaikan bila control plane memang jadi lebih lambat
+        baseline = self.baselines.get(key)
+        if baseline is None or latency < baseline:
+            baseline = latency
+        else:
+            baseline += (latency - baseline) * 0.01
+        self.baselines[key] = baseline
+        if latency > baseline * self.tolerance:
+            self.limit = max(self.minimum, self.limit * 0.9)
+        else:
+            self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+
+    def pause(self, seconds):
+        """Tahan semua request service ini (mis. dari Retry-After)."""
+        with self._cond:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
+def retry_after_seconds(response):
+    """Parse header Retry-After (detik atau HTTP-date). Return None bila tidak ada."""
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_seconds(attempt, base=BACKOFF_BASE_SEC, cap=BACKOFF_MAX_SEC):
+    """Exponential backoff dengan full jitter."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class Throttle:
+    """Registry limiter per service + wrapper untuk keystoneauth Session.request."""
+
+    def __init__(self, max_retries=MAX_RETRIES):
+        self.max_retries = max_retries
+        self.limiters = {}
+        self._lock = threading.Lock()
+
+    def limiter(self, service):
+        with self._lock:
+            if service not in self.limiters:
+                self.limiters[service] = AdaptiveLimiter(service)
+            return self.limiters[service]
+
+    def wrap(self, request):
+        def throttled_request(url, method, **kwargs):
+            service = service_type(kwargs)
+            limiter = self.limiter(service)
+            key = (method.upper(), url_template(url))
+
+            attempt = 0
+            while True:
+                limiter.acquire()
+                start = time.monotonic()
+                response = None
+                error = None
+                try:
+                    response = request(url, method, **kwargs)
+                except ks_exc.HttpError as e:
+                    # raise_exc=True: response tetap bisa diambil dari exception
+                    error = e
+                    response = e.response
+                except (ks_exc.ConnectFailure, ks_exc.ConnectTimeout) as e:
+                    # SSLError / UnknownConnectionError jatuh ke BaseException: raise tanpa retry
+                    error = e
+                except BaseException:
+                    limiter.release()
+                    raise
+
+                status = response.status_code if response is not None else None
+                overloaded = status in OVERLOAD_STATUS or (status is None and error is not None)
+                limiter.release(time.monotonic() - start, overloaded=overloaded, key=key)
+
+                idempotent = method.upper() in IDEMPOTENT_METHODS
+                if status is not None:
+                    retriable = status in OVERLOAD_STATUS or (status in GATEWAY_STATUS and idempotent)
+                else:
+                    # ConnectFailure = request belum terkirim, timeout hanya untuk method idempotent
+                    retriable = isinstance(error, ks_exc.ConnectFailure) or idempotent
+                if not retriable or attempt >= self.max_retries:
+                    if error is not None:
+                        raise error
+                    return response
+
+                delay = retry_after_seconds(response)
+                if delay is not None:
+                    limiter.pause(delay)
+                else:
+                    delay = backoff_seconds(attempt)
+                attempt += 1
+                LOG.warning(f"[throttle] {method} {service} got {status or type(error).__name__}, "
+                            f"retry {attempt}/{self.max_retries} in {delay:.1f}s")
+                time.sleep(delay)
+
+        throttled_request.__wrapped__ = request
+        return throttled_request
+
+
+def install(conn, throttle=None):
+    """Pasang throttle ke session koneksi openstacksdk. Aman dipanggil berulang."""
+    session = conn.session
+    if getattr(session, "_throttle", None) is not None:
+        return session._throttle
+    throttle = throttle or Throttle()
+    session.request = throttle.wrap(session.request)
+    session._throttle = throttle
+    return throttle
@@ -0,0 +1,221 @@
+"""
+Tracer opt-in untuk semua request openstacksdk dari satu run script.
+
+Aktif hanya bila env OS_TRACE_FILE di-set:
+
+    OS_TRACE_FILE=/tmp/orphan-trace.json python main.py all
+
+Setiap request dicatat (service, method, URL template, status, latency, ukuran payload
+request/response dan code site pemanggil di script). Saat proses selesai ditulis:
+- <OS_TRACE_FILE>         JSON: daftar call + ringkasan per code site / endpoint
+- <OS_TRACE_FILE>.folded  format folded stack (flamegraph.pl / speedscope), bobot = latency ms
+
+Bandingkan dua run (mis. sebelum dan sesudah fix N+1):
+
+    python tracer.py after.json before.json
+"""
+import os
+import re
+import sys
+import json
+import time
+import atexit
+import sysconfig
+import threading
+from collections import defaultdict
+from urllib.parse import urlsplit, parse_qsl
+
+TRACE_FILE = os.getenv("OS_TRACE_FILE")
+
+# Frame dari library / helper ini tidak dianggap sebagai code site. Dicocokkan dengan nama
+# module (bukan path), karena checkout repo bisa saja ada di path yang mengandung "/openstack/"
+_LIB_MODULES = ("openstack", "keystoneauth1", "requests", "urllib3", "concurrent", "threading",
+                "tracer", "throttle")
+# stdlib dan site-packages
+_LIB_PATHS = tuple(sorted({os.path.join(os.path.realpath(sysconfig.get_path(name)), "")
+                           for name in ("stdlib", "platstdlib", "purelib", "platlib")}))
+
+_ID_SEGMENT = re.compile(
+    r"^([0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}|[0-9a-f]{32}|\d+)$",
+    re.IGNORECASE,
+)
+
+
+def url_template(url):
+    """Ganti segmen ID (uuid/angka) dengan {id} dan buang nilai query: /v2.1/servers/{id}?all_tenants."""
+    parts = urlsplit(url)
+    path = "/".join("{id}" if _ID_SEGMENT.match(seg) else seg for seg in parts.path.split("/"))
+    query = sorted({key for key, _ in parse_qsl(parts.query, keep_blank_values=True)})
+    return path + ("?" + "&".join(query) if query else "")
+
+
+def service_type(kwargs):
+    """Nama service dari kwargs Session.request, sama untuk tracer dan throttle."""
+    endpoint_filter = kwargs.get("endpoint_filter") or {}
+    return endpoint_filter.get("service_type") or kwargs.get("microversion_service_type") or "default"
+
+
+def _is_lib_frame(frame):
+    module = frame.f_globals.get("__name__") or ""
+    if module.split(".", 1)[0] in _LIB_MODULES:
+        return True
+    filename = frame.f_code.co_filename
+    return filename.startswith("<") or os.path.realpath(filename).startswith(_LIB_PATHS)
+
+
+def _user_stack():
+    """Frame script pemanggil (root -> leaf) sebagai 'file:function:line'."""
+    frames = []
+    frame = sys._getframe(1)
+    while frame is not None:
+        if not _is_lib_frame(frame):
+            code = frame.f_code
+            frames.append(f"{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}")
+        frame = frame.f_back
+    frames.reverse()
+    return frames
+
+
+def _payload_size(kwargs):
+    if kwargs.get("json") is not None:
+        return len(json.dumps(kwargs["json"]))
+    data = kwargs.get("data")
+    if isinstance(data, (bytes, str)):
+        return len(data)
+    return 0
+
+
+def _response_size(response):
+    if response is None:
+        return 0
+    length = response.headers.get("Content-Length")
+    if length and length.isdigit():
+        return int(length)
+    # Response stream (mis. download image) tidak dibaca hanya untuk diukur
+    if getattr(response, "_content_consumed", True):
+        return len(response.content or b"")
+    return 0
+
+
+class Tracer:
+    def __init__(self, path):
+        self.path = path
+        self.calls = []
+        self.started = time.time()
+        self._lock = threading.Lock()
+
+    def wrap(self, request):
+        def traced_request(url, method, **kwargs):
+            service = service_type(kwargs)
+            stack = _user_stack()
+            start = time.monotonic()
+            response = None
+            try:
+                response = request(url, method, **kwargs)
+                return response
+            except Exception as e:
+                response = getattr(e, "response", None)
+                raise
+            finally:
+                call = {
+                    "service": service,
+                    "method": method.upper(),
+                    "url": url_template(url),
+                    "status": response.status_code if response is not None else None,
+                    "latency_ms": round((time.monotonic() - start) * 1000, 3),
+                    "request_bytes": _payload_size(kwargs),
+                    "response_bytes": _response_size(response),
+                    "site": stack[-1] if stack else "<unknown>",
+                    "stack": stack,
+                }
+                with self._lock:
+                    self.calls.append(call)
+
+        traced_request.__wrapped__ = request
+        return traced_request
+
+    def summary(self):
+        sites = defaultdict(lambda: {"calls": 0, "latency_ms": 0.0, "response_bytes": 0, "errors": 0})
+        endpoints = defaultdict(lambda: {"calls": 0, "latency_ms": 0.0})
+        for call in self.calls:
+            key = f"{call['site']} {call['method']} {call['service']} {call['url']}"
+            site = sites[key]
+            site["calls"] += 1
+            site["latency_ms"] += call["latency_ms"]
+            site["response_bytes"] += call["response_bytes"]
+            if call["status"] is None or call["status"] >= 400:
+                site["errors"] += 1
+            endpoint = endpoints[f"{call['method']} {call['service']} {call['url']}"]
+            endpoint["calls"] += 1
+            endpoint["latency_ms"] += call["latency_ms"]
+        return {
+            "total_calls": len(self.calls),
+            "total_latency_ms": round(sum(c["latency_ms"] for c in self.calls), 3),
+            "wall_time_s": round(time.time() - self.started, 3),
+            "sites": dict(sorted(sites.items(), key=lambda kv: -kv[1]["calls"])),
+            "endpoints": dict(sorted(endpoints.items(), key=lambda kv: -kv[1]["calls"])),
+        }
+
+    def folded(self):
+        """Folded stack: 'frame;frame;service METHOD url <latency_ms>' per baris."""
+        weights = defaultdict(float)
+        for call in self.calls:
+            frames = call["stack"] + [f"{call['service']} {call['method']} {call['url']}"]
+            weights[";".join(f.replace(";", ",").replace(" ", "_") for f in frames)] += call["latency_ms"]
+        return "".join(f"{stack} {max(int(round(ms)), 1)}\n" for stack, ms in sorted(weights.items()))
+
+    def write(self):
+        with self._lock:
+            data = {"argv": sys.argv, "summary": self.summary(), "calls": self.calls}
+            folded = self.folded()
+        with open(self.path, "w") as f:
+            json.dump(data, f, indent=1)
+        with open(self.path + ".folded", "w") as f:
+            f.write(folded)
+        print(f"[trace] {data['summary']['total_calls']} API calls recorded to {self.path}", file=sys.stderr)
+
+
+def install(conn, path=None):
+    """Pasang tracer ke session koneksi bila OS_TRACE_FILE (atau path) di-set. Return Tracer atau None."""
+    path = path or TRACE_FILE
+    if not path:
+        return None
+    session = conn.session
+    if getattr(session, "_tracer", None) is not None:
+        return session._tracer
+    tracer = Tracer(path)
+    session.request = tracer.wrap(session.request)
+    session._tracer = tracer
+    atexit.register(tracer.write)
+    return tracer
+
+
+def compare(current_path, baseline_path=None, top=20):
+    """Print code site dengan call terbanyak, dan selisih terhadap baseline bila ada."""
+    with open(current_path) as f:
+        current = json.load(f)["summary"]
+    baseline = {}
+    if baseline_path:
+        with open(baseline_path) as f:
+            baseline = json.load(f)["summary"]
+
+    print(f"Total calls: {current['total_calls']}"
+          + (f" (baseline {baseline['total_calls']})" if baseline else ""))
+    print(f"Total API latency: {current['total_latency_ms'] / 1000:.1f}s"
+          + (f" (baseline {baseline['total_latency_ms'] / 1000:.1f}s)" if baseline else ""))
+    print("")
+    print(f"{'calls':>8} {'delta':>8} {'latency_s':>10}  site / endpoint")
+    base_sites = baseline.get("sites", {})
+    keys = list(current["sites"])[:top]
+    keys += [k for k in list(base_sites)[:top] if k not in current["sites"]]
+    for key in keys:
+        cur = current["sites"].get(key, {"calls": 0, "latency_ms": 0.0})
+        delta = cur["calls"] - base_sites.get(key, {"calls": 0})["calls"] if baseline else ""
+        print(f"{cur['calls']:>8} {delta:>8} {cur['latency_ms'] / 1000:>10.2f}  {key}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) not in (2, 3):
+        print("Usage: tracer.py <trace.json> [baseline.json]")
+        sys.exit(1)
+    compare(*sys.argv[1:])
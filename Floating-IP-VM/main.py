@@ -1,74 +1,80 @@
-import openstack
 import csv
 import os
-import shlex
+import sys
+from openstack import exceptions as os_exc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Common"))
+from oscloud import connect
 
 # === ✅ SET NAMA FILE OPENRC DI SINI ===
 OPENRC_FILE = "openrc"
 
-def load_openrc(file_path):
-    with open(file_path, "r") as f:
-        for line in f:
-            line = line.strip()
-            if line.startswith("export "):
-                parts = line.replace("export ", "").split("=", 1)
-                if len(parts) == 2:
-                    key = parts[0]
-                    val = shlex.split(parts[1])[0]
-                    os.environ[key] = val
-
-# Load environment dari openrc
-load_openrc(OPENRC_FILE)
+# File output CSV
+CSV_FILE = "floating_ip_report.csv"
+HEADER = ["Floating IP", "Status", "Instance Name", "Instance ID", "User ID", "Username", "Project Name"]
 
-# Koneksi ke OpenStack
-conn = openstack.connect()
+def write_fip_report(conn, csv_file=CSV_FILE):
+    with open(csv_file, mode="w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADER)
 
-# File output CSV
-csv_file = "floating_ip_report.csv"
-header = ["Floating IP", "Status", "Instance Name", "Instance ID", "User ID", "Username", "Project Name"]
+        for fip in conn.network.ips():
+            floating_ip = fip.floating_ip_address
+            status = fip.status
+            instance_name = "-"
+            instance_id = "-"
+            user_id = "-"
+            username = "-"
+            project_name = "-"
 
-with open(csv_file, mode="w", newline="") as f:
-    writer = csv.writer(f)
-    writer.writerow(header)
+            # Ambil project name dari fip.project_id
+            try:
+                project = conn.identity.get_project(fip.project_id)
+                if project:
+                    project_name = project.name
+            except os_exc.NotFoundException:
+                project_name = "None"
+            except os_exc.SDKException as e:
+                print(f"⚠️  Gagal mengambil project {fip.project_id}: {e}")
+                project_name = "ERROR"
 
-    for fip in conn.network.ips():
-        floating_ip = fip.floating_ip_address
-        status = fip.status
-        instance_name = "-"
-        instance_id = "-"
-        user_id = "-"
-        username = "-"
-        project_name = "-"
+            if fip.port_id:
+                try:
+                    port = conn.network.get_port(fip.port_id)
+                    device_id = port.device_id
+                    if device_id:
+                        server = conn.compute.get_server(device_id)
+                        if server:
+                            instance_name = server.name
+                            instance_id = server.id
+                            user_id = server.user_id
 
-        # Ambil project name dari fip.project_id
-        try:
-            project = conn.identity.get_project(fip.project_id)
-            if project:
-                project_name = project.name
-        except Exception:
-            project_name = "None"
+                            # Ambil username dari user_id
+                            try:
+                                user = conn.identity.get_user(user_id)
+                                if user:
+                                    username = user.name
+                            except os_exc.NotFoundException:
+                                username = "None"
+                            except os_exc.SDKException as e:
+                                print(f"⚠️  Gagal mengambil user {user_id}: {e}")
+                                username = "ERROR"
+                except os_exc.NotFoundException:
+                    # Port / server sudah dihapus
+                    pass
+                except os_exc.SDKException as e:
+                    print(f"⚠️  Gagal mengambil detail {floating_ip}: {e}")
+                    instance_name = "ERROR"
 
-        if fip.port_id:
-            try:
-                port = conn.network.get_port(fip.port_id)
-                device_id = port.device_id
-                if device_id:
-                    server = conn.compute.get_server(device_id)
-                    if server:
-                        instance_name = server.name
-                        instance_id = server.id
-                        user_id = server.user_id
+            writer.writerow([floating_ip, status, instance_name, instance_id, user_id, username, project_name])
 
-                        # Ambil username dari user_id
-                        try:
-                            user = conn.identity.get_user(user_id)
-                            if user:
-                                username = user.name
-                        except Exception:
-                            username = "None"
-            except Exception:
-                pass
+if __name__ == "__main__":
+    # Load environment dari openrc lalu koneksi ke OpenStack
+    # (atau inventory snapshot tanpa openrc bila OS_INVENTORY_SNAPSHOT di-set)
+    conn = connect(OPENRC_FILE)
+    if not conn:
+        sys.exit(1)
 
-        writer.writerow([floating_ip, status, instance_name, instance_id, user_id, username, project_name])
+    write_fip_report(conn, CSV_FILE)
 
-print(f"\n✅ Output berhasil disimpan ke file: {csv_file}")
+    print(f"\n✅ Output berhasil disimpan ke file: {CSV_FILE}")
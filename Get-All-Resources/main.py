@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+import sys
+import os
+import csv
+import logging
+import argparse
+import requests
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'Common'))
+from oscloud import connect
+
+# Variable Definitions
+OPENRC_PATH = '/path/to/rcfile'
+OUTPUT_BASE_DIR = '/tmp'
+BOT_TOKEN = "telegram_bot_token"
+CHAT_ID = "telegram_chat_id"
+
+SERVER_HEADERS = ['Instance ID', 'Instance Name', 'Power State', 'Status', 'Flavor', 'Hypervisor', 'Libvirt ID',
+                  'Project Name']
+PROJECT_HEADERS = ['ID', 'Name', 'Domain ID', 'Domain Name']
+DOMAIN_HEADERS = ['ID', 'Name']
+
+# Sama dengan mapping power state pada openstack CLI
+POWER_STATES = {0: 'NOSTATE', 1: 'Running', 3: 'Paused', 4: 'Shutdown', 6: 'Crashed', 7: 'Suspended'}
+
+FORMAT = '%(process)d-%(levelname)s-%(message)s'
+logging.basicConfig(format=FORMAT, level=logging.INFO)
+LOG = logging.getLogger(__name__)
+
+
+def get_flavor_names(conn):
+    # is_public=None (objek) dibuang oleh requests sehingga Nova hanya mengembalikan flavor publik,
+    # string 'None' = semua flavor termasuk private
+    return {flavor.id: flavor.name for flavor in conn.compute.flavors(is_public='None')}
+
+
+def flavor_name(server, flavors):
+    # Microversion >= 2.47 mengembalikan flavor embedded (original_name), versi lama hanya id
+    flavor = server.flavor or {}
+    return flavor.get("original_name") or flavor.get("name") or flavors.get(flavor.get("id"), flavor.get("id", ""))
+
+
+def write_server_csv(conn, csv_path, projects):
+    """Satu listing server detail (admin) sudah berisi host dan instance_name."""
+    flavors = get_flavor_names(conn)
+    count = 0
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(SERVER_HEADERS)
+        for server in conn.compute.servers(details=True, all_projects=True):
+            writer.writerow([
+                server.id,
+                server.name,
+                POWER_STATES.get(server.power_state, server.power_state),
+                server.status,
+                flavor_name(server, flavors),
+                server.compute_host or "",
+                server.instance_name or "",
+                projects.get(server.project_id, {}).get("name", ""),
+            ])
+            count += 1
+    return count
+
+
+def get_projects(conn):
+    return {p.id: {"name": p.name, "domain_id": p.domain_id} for p in conn.identity.projects()}
+
+
+def get_domain_names(conn):
+    return {domain.id: domain.name for domain in conn.identity.domains()}
+
+
+def write_project_csv(projects, domains, csv_path):
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(PROJECT_HEADERS)
+        for project_id, project in projects.items():
+            writer.writerow([project_id, project["name"], project["domain_id"],
+                             domains.get(project["domain_id"], "")])
+
+
+def write_domain_csv(domains, csv_path):
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(DOMAIN_HEADERS)
+        for domain_id, name in domains.items():
+            writer.writerow([domain_id, name])
+
+
+def count_volumes(conn):
+    return sum(1 for _ in conn.block_storage.volumes(details=False, all_projects=True))
+
+
+def send_message_to_telegram(text, bot_token, chat_id):
+    url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+    response = requests.post(url, data={'chat_id': chat_id, 'parse_mode': 'HTML', 'text': text})
+    if response.status_code != 200:
+        LOG.error(f"Gagal mengirim pesan ke Telegram. Status: {response.status_code}, Pesan: {response.text}")
+
+
+def send_file_to_telegram(file_path, bot_token, chat_id):
+    url = f"https://api.telegram.org/bot{bot_token}/sendDocument"
+    with open(file_path, 'rb') as f:
+        files = {'document': (os.path.basename(file_path), f)}
+        data = {'chat_id': chat_id}
+        response = requests.post(url, files=files, data=data)
+    if response.status_code == 200:
+        LOG.info("File berhasil dikirim ke Telegram.")
+    else:
+        LOG.error(f"Gagal mengirim file ke Telegram. Status: {response.status_code}, Pesan: {response.text}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Export semua server, project dan domain ke CSV")
+    parser.add_argument("--output-dir", default=OUTPUT_BASE_DIR)
+    parser.add_argument("--no-telegram", action="store_true", help="jangan kirim file ke Telegram")
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+
+    date = datetime.now().strftime('%d-%b-%y')
+    output_dir = os.path.join(args.output_dir, date)
+    os.makedirs(output_dir, exist_ok=True)
+    server_csv = os.path.join(output_dir, f"{date}-server.csv")
+    project_csv = os.path.join(output_dir, f"{date}-project.csv")
+    domain_csv = os.path.join(output_dir, f"{date}-domain.csv")
+    readme = os.path.join(output_dir, "README")
+
+    conn = connect(OPENRC_PATH)
+    if not conn:
+        sys.exit(1)
+
+    projects = get_projects(conn)
+    domains = get_domain_names(conn)
+    count_all_vm = write_server_csv(conn, server_csv, projects)
+    write_project_csv(projects, domains, project_csv)
+    write_domain_csv(domains, domain_csv)
+    count_volume = count_volumes(conn)
+
+    with open(readme, "w") as f:
+        f.write(f"All Instances count at {date}: {count_all_vm}\n")
+        f.write(f"All volume count at {date}: {count_volume}\n")
+    LOG.info(f"Exported {count_all_vm} servers to {output_dir}")
+
+    if not args.no_telegram:
+        now = datetime.now().strftime('%A %e %B %Y %T')
+        send_message_to_telegram(
+            "<b>✅ [ INFO ALERT ] ✅</b>\nExporting all resources in <b>RHOSP Cluster</b> "
+            f"successfully executed on {now} WIB.\nReady to process in Excel:",
+            BOT_TOKEN, CHAT_ID)
+        for file_path in (server_csv, project_csv, domain_csv):
+            send_file_to_telegram(file_path, BOT_TOKEN, CHAT_ID)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+import sys
+import os
+import csv
+import logging
+import argparse
+import requests
+from collections import defaultdict
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'Common'))
+from oscloud import connect
+
+# Variable Definitions
+OPENRC_PATH = '/path/to/rcfile'
+OUTPUT_BASE_DIR = '/tmp'
+BOT_TOKEN = "telegram_bot_token"
+CHAT_ID = "telegram_chat_id"
+
+CSV_HEADERS = ['Volume ID', 'Volume Name', 'Status', 'Size', 'Type', 'Migration Status', 'Cinder Pool',
+               'Instance ID', 'Project ID', 'Image ID', 'Image Name', 'Snapshot Count']
+
+FORMAT = '%(process)d-%(levelname)s-%(message)s'
+logging.basicConfig(format=FORMAT, level=logging.INFO)
+LOG = logging.getLogger(__name__)
+
+
+def get_snapshot_index(conn):
+    """Satu listing snapshot semua project -> volume_id: [jumlah snapshot, total size GB]."""
+    index = defaultdict(lambda: [0, 0])
+    for snap in conn.block_storage.snapshots(details=True, all_projects=True):
+        entry = index[snap.volume_id]
+        entry[0] += 1
+        entry[1] += snap.size or 0
+    return index
+
+
+def get_pool(volume):
+    # os-vol-host-attr:host formatnya host@backend#pool
+    host = volume.host or ""
+    return host.split("#")[-1] if host else "-"
+
+
+def volume_row(volume, snapshot_count):
+    attachments = volume.attachments or []
+    instance_ids = " ".join(a.get("server_id", "") for a in attachments if a.get("server_id"))
+    image_meta = volume.volume_image_metadata or {}
+    return [
+        volume.id,
+        volume.name or "",
+        volume.status,
+        volume.size,
+        volume.volume_type or "",
+        volume.migration_status or "",
+        get_pool(volume),
+        instance_ids,
+        volume.project_id,
+        image_meta.get("image_id", ""),
+        image_meta.get("image_name", ""),
+        snapshot_count,
+    ]
+
+
+def write_volume_report(conn, csv_path):
+    """
+    Tulis CSV volume secara streaming dari satu listing volume detail dan
+    kembalikan summary per pool.
+    """
+    snapshots = get_snapshot_index(conn)
+    pools = defaultdict(lambda: {"volumes": 0, "capacity_gb": 0, "snapshots": 0, "snapshot_gb": 0})
+    volumes_with_snapshot = set()
+
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_HEADERS)
+        for volume in conn.block_storage.volumes(details=True, all_projects=True):
+            snap_count, snap_gb = snapshots.get(volume.id, (0, 0))
+            pool = pools[get_pool(volume)]
+            pool["volumes"] += 1
+            pool["capacity_gb"] += volume.size or 0
+            pool["snapshots"] += snap_count
+            pool["snapshot_gb"] += snap_gb
+            if snap_count:
+                volumes_with_snapshot.add(volume.id)
+            writer.writerow(volume_row(volume, snap_count))
+
+    return pools, volumes_with_snapshot
+
+
+def write_summary(pools, summary_path):
+    total_snapshot = sum(p["snapshots"] for p in pools.values())
+    with open(summary_path, "w") as f:
+        f.write("=== Snapshot Summary per Pool ===\n")
+        for name in sorted(pools):
+            p = pools[name]
+            f.write(f"Pool {name} memiliki {p['snapshots']} snapshot ({p['snapshot_gb']} GB), "
+                    f"{p['volumes']} volume ({p['capacity_gb']} GB)\n")
+        f.write(f"TOTAL semua snapshot = {total_snapshot}\n")
+
+
+def write_snapshot_check(volume_file, output_file, volumes_with_snapshot):
+    """Pengganti Check-Snapshot-Volume: tulis volume_id dari volume_file yang punya snapshot."""
+    with open(volume_file) as src, open(output_file, "w") as dst:
+        for line in src:
+            volume_id = line.strip()
+            if volume_id and volume_id in volumes_with_snapshot:
+                dst.write(f"{volume_id}\n")
+
+
+def send_file_to_telegram(file_path, bot_token, chat_id):
+    url = f"https://api.telegram.org/bot{bot_token}/sendDocument"
+    with open(file_path, 'rb') as f:
+        files = {'document': (os.path.basename(file_path), f)}
+        data = {'chat_id': chat_id}
+        response = requests.post(url, files=files, data=data)
+    if response.status_code == 200:
+        LOG.info("File berhasil dikirim ke Telegram.")
+    else:
+        LOG.error(f"Gagal mengirim file ke Telegram. Status: {response.status_code}, Pesan: {response.text}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Report semua volume beserta summary snapshot per pool")
+    parser.add_argument("--output-dir", default=OUTPUT_BASE_DIR)
+    parser.add_argument("--volume-file", help="file volume_id (seperti data-volume.txt) untuk dicek snapshotnya")
+    parser.add_argument("--snapshot-output", default="snapshot-volume.txt")
+    parser.add_argument("--no-telegram", action="store_true", help="jangan kirim file ke Telegram")
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+
+    date = datetime.now().strftime('%d-%b-%y')
+    output_dir = os.path.join(args.output_dir, date)
+    os.makedirs(output_dir, exist_ok=True)
+    volume_csv = os.path.join(output_dir, f"{date}-volume.csv")
+    summary_txt = os.path.join(output_dir, f"{date}-snapshot-summary.txt")
+
+    conn = connect(OPENRC_PATH)
+    if not conn:
+        sys.exit(1)
+
+    pools, volumes_with_snapshot = write_volume_report(conn, volume_csv)
+    write_summary(pools, summary_txt)
+    LOG.info(f"Volume report saved to {volume_csv}, summary saved to {summary_txt}")
+
+    if args.volume_file:
+        write_snapshot_check(args.volume_file, args.snapshot_output, volumes_with_snapshot)
+        LOG.info(f"Volume with snapshot saved to {args.snapshot_output}")
+
+    if not args.no_telegram:
+        for file_path in (volume_csv, summary_txt):
+            send_file_to_telegram(file_path, BOT_TOKEN, CHAT_ID)
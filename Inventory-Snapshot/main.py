@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+import sys
+import os
+import logging
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'Common'))
+from oscloud import load_openrc, connect_api
+import inventory
+
+# Change with your rc file
+OPENRC_PATH = '/path/to/rcfile'
+OUTPUT_BASE_DIR = '/var/lib/os-inventory'
+KEEP_SNAPSHOTS = 14
+
+FORMAT = '%(process)d-%(levelname)s-%(message)s'
+logging.basicConfig(format=FORMAT, level=logging.INFO)
+LOG = logging.getLogger(__name__)
+
+
+def collect_region(region, base_dir, kinds, keep):
+    # Collector selalu ke API, abaikan OS_INVENTORY_SNAPSHOT
+    conn = connect_api(region)
+    if not conn:
+        return region, None
+    path = inventory.collect(conn, base_dir, region, kinds)
+    inventory.prune(base_dir, region, keep)
+    LOG.info(f"Snapshot {region} saved to {path}")
+    return region, path
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Ambil inventory snapshot kolumnar per region")
+    parser.add_argument("regions", nargs="*", help="region (default OS_REGION_NAME dari openrc)")
+    parser.add_argument("--output-dir", default=OUTPUT_BASE_DIR)
+    parser.add_argument("--kinds", nargs="+", choices=list(inventory.SCHEMAS),
+                        help="default semua resource; snapshot sebagian tidak dipakai sebagai snapshot terbaru region")
+    parser.add_argument("--keep", type=int, default=KEEP_SNAPSHOTS, help="jumlah snapshot yang disimpan per region")
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+
+    load_openrc(OPENRC_PATH)
+    regions = args.regions or [os.getenv("OS_REGION_NAME", "RegionOne")]
+
+    with ThreadPoolExecutor(max_workers=len(regions)) as executor:
+        results = list(executor.map(lambda r: collect_region(r, args.output_dir, args.kinds, max(args.keep, 1)),
+                                    regions))
+
+    if any(path is None for _, path in results):
+        sys.exit(1)
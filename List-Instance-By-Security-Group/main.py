@@ -1,29 +1,192 @@
-#!/bin/bash
+#!/usr/bin/env python3
+import sys
+import os
+import json
+import time
+import hashlib
+import tempfile
+import logging
+import argparse
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'Common'))
+from oscloud import load_openrc, connect, use_snapshot
 
-source /path/to/rc/file
+# Change with your rc file
+OPENRC_PATH = '/path/to/rcfile'
 
-read -p "Masukkan nama Security Group: " SEC_GROUP
+# Cache index security group -> ports -> servers, per user (mode 0600) dan per cloud
+CACHE_DIR = os.path.join(os.getenv('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'openstack-script')
+CACHE_MAX_AGE_SEC = 900
 
-read -p "Masukkan Project ID: " PROJECT_ID
+FORMAT = '%(process)d-%(levelname)s-%(message)s'
+logging.basicConfig(format=FORMAT, level=logging.INFO)
+LOG = logging.getLogger(__name__)
 
 
-echo ""
-echo "🔍 Mencari VM yang menggunakan Security Group: '$SEC_GROUP'..."
-echo ""
+def build_index(conn):
+    """
+    Bangun reverse index security group -> ports -> servers dengan 3 listing bulk
+    (security groups, ports, servers) untuk semua project.
+    """
+    groups = {}
+    for sg in conn.network.security_groups():
+        groups[sg.id] = {"name": sg.name, "project_id": sg.project_id, "ports": []}
 
-openstack server list --project $PROJECT_ID -f json | jq -r '.[].ID' | while read id; do
-    VM_INFO=$(openstack server show "$id" -f json)
-    VM_NAME=$(echo "$VM_INFO" | jq -r '.name')
-    VM_ID=$(echo "$VM_INFO" | jq -r '.id')
-    MATCH=$(echo "$VM_INFO" | jq -r --arg SEC_GROUP "$SEC_GROUP" 'select(.security_groups[]?.name == $SEC_GROUP)')
-    
-    if [[ ! -z "$MATCH" ]]; then
-        echo "-------------------------------------------"
-        echo "🖥️  Nama VM : $VM_NAME"
-        echo "🆔 ID VM    : $VM_ID"
-    fi
-done
+    ports = {}
+    for port in conn.network.ports():
+        if not (port.device_owner or "").startswith("compute:"):
+            continue
+        ports[port.id] = {"device_id": port.device_id, "project_id": port.project_id}
+        for sg_id in port.security_group_ids or []:
+            if sg_id in groups:
+                groups[sg_id]["ports"].append(port.id)
 
-echo ""
-echo "✅ Selesai mencari VM yang menggunakan Security Group: '$SEC_GROUP' di Project ID: '$PROJECT_ID'"
+    # details=False cukup untuk id + name, jauh lebih ringan dari server show
+    servers = {}
+    for server in conn.compute.servers(details=False, all_projects=True):
+        servers[server.id] = server.name
+
+    return {"created_at": time.time(), "groups": groups, "ports": ports, "servers": servers}
+
+
+def cache_source():
+    """
+    Identitas sumber index: index dari cloud / region / credential scope / snapshot lain
+    tidak boleh dipakai (mis. index admin semua project untuk rc non-admin).
+    """
+    snapshot = os.getenv('OS_INVENTORY_SNAPSHOT')
+    if snapshot:
+        # Dir region -> snapshot terbaru, supaya snapshot baru langsung memakai index baru
+        import inventory
+        snapshot = os.path.realpath(inventory.resolve_snapshot(snapshot))
+    return {
+        "auth_url": os.getenv('OS_AUTH_URL', ''),
+        "region": os.getenv('OS_REGION_NAME', ''),
+        "username": os.getenv('OS_USERNAME', ''),
+        "user_domain": os.getenv('OS_USER_DOMAIN_NAME') or os.getenv('OS_USER_DOMAIN_ID', ''),
+        "project": os.getenv('OS_PROJECT_ID') or os.getenv('OS_PROJECT_NAME', ''),
+        "project_domain": os.getenv('OS_PROJECT_DOMAIN_NAME') or os.getenv('OS_PROJECT_DOMAIN_ID', ''),
+        "snapshot": snapshot or '',
+    }
+
+
+def default_cache_file(source):
+    digest = hashlib.sha256(json.dumps(source, sort_keys=True).encode()).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, f"secgroup_index-{digest}.json")
+
+
+def read_cache(cache_file, source, max_age):
+    try:
+        with open(cache_file) as f:
+            index = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        LOG.warning(f"Ignoring unreadable cache {cache_file}: {e}")
+        return None
+    if index.get("source") != source:
+        LOG.info(f"Cache {cache_file} is from another cloud/region/snapshot, rebuilding")
+        return None
+    age = time.time() - index.get("created_at", 0)
+    if age > max_age:
+        return None
+    LOG.info(f"Using cached index {cache_file} (age {int(age)}s)")
+    return index
+
+
+def write_cache(cache_file, index):
+    """Tulis atomik (file sementara + os.replace) dengan mode 0600, index berisi data semua project."""
+    cache_dir = os.path.dirname(os.path.abspath(cache_file))
+    os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=".secgroup_index-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, cache_file)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_index(conn, cache_file=None, max_age=CACHE_MAX_AGE_SEC, refresh=False):
+    source = cache_source()
+    cache_file = cache_file or default_cache_file(source)
+    if not refresh:
+        index = read_cache(cache_file, source, max_age)
+        if index is not None:
+            return index
+
+    if conn is None:
+        conn = connect()
+        if not conn:
+            sys.exit(1)
+
+    LOG.info("Building security group index...")
+    index = build_index(conn)
+    index["source"] = source
+    write_cache(cache_file, index)
+    LOG.info(f"Index saved to {cache_file}: {len(index['groups'])} security groups, "
+             f"{len(index['ports'])} ports, {len(index['servers'])} servers")
+    return index
+
+
+def find_servers(index, sec_group, project_id=None):
+    """
+    Cari VM yang memakai security group (nama atau ID). project_id membatasi project VM,
+    bukan pemilik security group (group bisa di-share lewat RBAC ke project lain).
+    Return list of (sg_id, sg_project_id, [(server_id, server_name), ...]).
+    """
+    results = []
+    for sg_id, sg in index["groups"].items():
+        if sec_group not in (sg_id, sg["name"]):
+            continue
+        seen = {}
+        for port_id in sg["ports"]:
+            port = index["ports"].get(port_id)
+            if not port or port["device_id"] in seen:
+                continue
+            if project_id and port["project_id"] != project_id:
+                continue
+            seen[port["device_id"]] = index["servers"].get(port["device_id"], "-")
+        if project_id and not seen and sg["project_id"] != project_id:
+            # Group project lain yang tidak dipakai VM project ini
+            continue
+        results.append((sg_id, sg["project_id"], sorted(seen.items(), key=lambda s: s[1] or "")))
+    return results
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="List instance yang memakai security group tertentu")
+    parser.add_argument("sec_groups", nargs="+", help="nama atau ID security group")
+    parser.add_argument("--project", help="batasi ke VM di Project ID tertentu (default semua project)")
+    parser.add_argument("--cache-file", help=f"default per cloud/region di {CACHE_DIR}")
+    parser.add_argument("--max-age", type=int, default=CACHE_MAX_AGE_SEC,
+                        help="umur maksimal cache dalam detik")
+    parser.add_argument("--refresh", action="store_true", help="abaikan cache dan bangun ulang index")
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+
+    # openrc dibutuhkan sebelum connect() untuk cache key (credential scope), kecuali snapshot
+    if not use_snapshot():
+        load_openrc(OPENRC_PATH)
+    # Koneksi hanya dibuat kalau cache tidak ada / kadaluarsa
+    index = load_index(None, args.cache_file, args.max_age, args.refresh)
+
+    for sec_group in args.sec_groups:
+        print("")
+        print(f"🔍 Mencari VM yang menggunakan Security Group: '{sec_group}'...")
+        matches = find_servers(index, sec_group, args.project)
+        if not matches:
+            print(f"⚠️  Security Group '{sec_group}' tidak ditemukan")
+            continue
+        for sg_id, sg_project, servers in matches:
+            print(f"🛡️  Security Group {sg_id} (Project ID: {sg_project}) - {len(servers)} VM")
+            for server_id, server_name in servers:
+                print("-------------------------------------------")
+                print(f"🖥️  Nama VM : {server_name}")
+                print(f"🆔 ID VM    : {server_id}")
+        print("")
+        print(f"✅ Selesai mencari VM yang menggunakan Security Group: '{sec_group}'")
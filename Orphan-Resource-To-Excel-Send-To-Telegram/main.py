@@ -1,8 +1,6 @@
 #!/usr/bin/env python3
 import sys
 import logging
-import openstack
-import os_client_config
 import csv
 import pandas as pd
 import os
@@ -10,12 +8,19 @@ from datetime import datetime
 import requests
 import re
 
-# Variable Definitions (to be defined at the beginning of the script)
-OPENRC_PATH = '/path/to/rcfile'
-OUTPUT_BASE_DIR = '/path/to/output/dir'
-BOT_TOKEN = "telegram_bot_token"
-CHAT_ID = "telegram_chat_id"
-LOG_FILE_PATH = '/path/to/log/dir'
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'Common'))
+from oscloud import connect
+
+# Variable Definitions (to be defined at the beginning of the script, or override via env)
+OPENRC_PATH = os.getenv('OPENRC_PATH', '/path/to/rcfile')
+OUTPUT_BASE_DIR = os.getenv('OUTPUT_BASE_DIR', '/path/to/output/dir')
+BOT_TOKEN = os.getenv('BOT_TOKEN', "telegram_bot_token")
+CHAT_ID = os.getenv('CHAT_ID', "telegram_chat_id")
+LOG_FILE_PATH = os.getenv('LOG_FILE_PATH', '/path/to/log/dir')
+TELEGRAM_API_URL = os.getenv('TELEGRAM_API_URL', "https://api.telegram.org")
+
+VALID_OPTIONS = ['servers', 'volumes', 'volume_snapshots', 'image_snapshots', 'secgroups',
+                 'networks', 'routers', 'subnets', 'floatingips', 'ports']
 
 today_str = datetime.now().strftime('%Y%m%d')
 OUTPUT_EXCEL = os.path.join(OUTPUT_BASE_DIR, today_str, f"{today_str}-Orphan-Resources.xlsx")
@@ -33,16 +38,6 @@ file_handler = logging.FileHandler(LOG_FILE_PATH)
 file_handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATEFMT))
 LOG.addHandler(file_handler)
 
-def connect():
-    try:
-        config = os_client_config.get_config()
-        conn = openstack.connection.Connection(config=config)
-        conn.authorize()
-        return conn
-    except Exception as curr_error:
-        LOG.exception('Connection error : %s', curr_error, exc_info=1)
-        sys.exit(1)
-
 def get_projects_ids(conn):
     return [project.id for project in conn.identity.projects()]
 
@@ -156,19 +151,8 @@ def combine_csv_to_excel(csv_files, output_excel):
 
         LOG.info(f"Combined Excel saved to {output_excel}")
 
-def load_openrc(file_path):
-    with open(file_path) as f:
-        for line in f:
-            if line.strip().startswith("#") or not line.strip():
-                continue
-            if line.startswith("export"):
-                key_value = line.strip().split("export ")[1]
-                key, val = key_value.split("=", 1)
-                val = val.strip('"').strip("'")
-                os.environ[key.strip()] = val.strip()
-
 def send_file_to_telegram(file_path, bot_token, chat_id):
-    url = f"https://api.telegram.org/bot{bot_token}/sendDocument"
+    url = f"{TELEGRAM_API_URL}/bot{bot_token}/sendDocument"
     with open(file_path, 'rb') as f:
         files = {'document': (os.path.basename(file_path), f)}
         data = {'chat_id': chat_id}
@@ -184,21 +168,7 @@ def prepare_output_directory(base_dir=OUTPUT_BASE_DIR):
     os.makedirs(output_dir, exist_ok=True)
     return output_dir
 
-if __name__ == '__main__':
-
-    # Load OpenRC and establish connection
-    load_openrc(OPENRC_PATH)
-    conn = connect()
-    projectids = get_projects_ids(conn)
-
-    valid_options = ['servers', 'volumes', 'volume_snapshots', 'image_snapshots', 'secgroups',
-                     'networks', 'routers', 'subnets', 'floatingips', 'ports']
-
-    ostack_objects = valid_options
-    output_dir = prepare_output_directory()
-    today_str = datetime.now().strftime('%Y-%m-%d')
-    LOG.debug(f"Script berjalan pada tanggal {today_str}, output disimpan di {output_dir}")
-
+def collect_orphan_csvs(conn, projectids, output_dir, ostack_objects=VALID_OPTIONS):
     csv_files = []
 
     for ostack_object in ostack_objects:
@@ -219,6 +189,22 @@ if __name__ == '__main__':
         else:
             LOG.info(f"No orphan {original_object} found.")
 
+    return csv_files
+
+if __name__ == '__main__':
+
+    # Load OpenRC and establish connection (or open the inventory snapshot)
+    conn = connect(OPENRC_PATH)
+    if not conn:
+        sys.exit(1)
+    projectids = get_projects_ids(conn)
+
+    output_dir = prepare_output_directory()
+    today_str = datetime.now().strftime('%Y-%m-%d')
+    LOG.debug(f"Script berjalan pada tanggal {today_str}, output disimpan di {output_dir}")
+
+    csv_files = collect_orphan_csvs(conn, projectids, output_dir)
+
     combine_csv_to_excel(csv_files, OUTPUT_EXCEL)
 
     # Send file to Telegram
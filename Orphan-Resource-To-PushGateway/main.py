@@ -1,12 +1,13 @@
 #!/usr/bin/env python3
 import sys
 import logging
-import openstack
-import os_client_config
 import os
 import requests
 from urllib.parse import urlparse
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'Common'))
+from oscloud import connect
+
 # Change with your rc file
 OPENRC_PATH = '/path/to/rcfile'
 
@@ -29,16 +30,6 @@ def usage():
     print("'volumes', 'volume_snapshots', 'image_snapshots', 'secgroups' or 'all'")
 
 
-def connect():
-    try:
-        config = os_client_config.get_config()
-        conn = openstack.connection.Connection(config=config)
-        conn.authorize()
-        return conn
-    except Exception as e:
-        LOG.exception('Connection error: %s', e, exc_info=True)
-
-
 def get_projects_ids(conn):
     return [project.id for project in conn.identity.projects()]
 
@@ -75,20 +66,6 @@ def generate_metric_line(metric_name, labels: dict, value: int = 1) -> str:
     label_str = ",".join([f'{k}="{v}"' for k, v in labels.items()])
     return f'{metric_name}{{{label_str}}} {value}'
 
-def load_openrc(file_path):
-    """Load OpenStack RC file like `source` does in shell."""
-    with open(file_path) as f:
-        for line in f:
-            # Lewati komentar atau baris kosong
-            if line.strip().startswith("#") or not line.strip():
-                continue
-            if line.startswith("export"):
-                # Ambil key dan value
-                key_value = line.strip().split("export ")[1]
-                key, val = key_value.split("=", 1)
-                val = val.strip('"').strip("'")  # Hapus tanda kutip
-                os.environ[key.strip()] = val.strip()
-
 def get_orphan_objs(conn, projectids, obj):
     projectids.append("")
     metrics = []
@@ -220,9 +197,31 @@ def get_orphan_objs(conn, projectids, obj):
     return metrics
 
 
+def push_orphan_metrics(conn, projectids, ostack_object, pushgateway_url=PUSHGATEWAY_URL):
+    # Normalize
+    if ostack_object == "secgroups":
+        ostack_object = "security_groups"
+    if ostack_object == "floatingips":
+        ostack_object = "floating_ips"
+
+    LOG.info(f"Checking {ostack_object}...")
+    metrics = get_orphan_objs(conn, projectids, ostack_object)
+    job_name = f"orphan_{ostack_object}"
+
+    delete_old_metrics(pushgateway_url, job_name)
+
+    if metrics:
+        # Include type declaration
+        metric_type = f"# TYPE {job_name} untyped\n"
+        metric_data = metric_type + "\n".join(metrics) + "\n"
+        push_metrics(pushgateway_url, job_name, metric_data)
+    else:
+        LOG.info(f"No orphan {ostack_object}")
+    return len(metrics)
+
+
 if __name__ == '__main__':
-    load_openrc(OPENRC_PATH)
-    conn = connect()
+    conn = connect(OPENRC_PATH)
     if not conn:
         sys.exit(1)
 
@@ -240,24 +239,6 @@ if __name__ == '__main__':
                 usage()
                 sys.exit(1)
 
-            # Normalize
-            if ostack_object == "secgroups":
-                ostack_object = "security_groups"
-            if ostack_object == "floatingips":
-                ostack_object = "floating_ips"
-
-            LOG.info(f"Checking {ostack_object}...")
-            metrics = get_orphan_objs(conn, projectids, ostack_object)
-            job_name = f"orphan_{ostack_object}"
-
-            delete_old_metrics(PUSHGATEWAY_URL, job_name)
-
-            if metrics:
-                # Include type declaration
-                metric_type = f"# TYPE {job_name} untyped\n"
-                metric_data = metric_type + "\n".join(metrics) + "\n"
-                push_metrics(PUSHGATEWAY_URL, job_name, metric_data)
-            else:
-                LOG.info(f"No orphan {ostack_object}")
+            push_orphan_metrics(conn, projectids, ostack_object)
     else:
         usage()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 import os
+import sys
 import time
 from typing import Dict, List, Optional
 
@@ -9,6 +10,9 @@ from dotenv import load_dotenv
 from openstack import connection
 from openstack import exceptions as os_exc
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Common"))
+from oscloud import instrument
+
 # =========================
 # Load .env & Config
 # =========================
@@ -52,7 +56,7 @@ def build_connection():
         identity_interface="public",
     )
 
-conn = build_connection()
+conn = instrument(build_connection())
 
 # =========================
 # FastAPI
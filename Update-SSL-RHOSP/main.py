@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+import sys
+import os
+import shlex
+import shutil
+import filecmp
+import hashlib
+import logging
+import argparse
+import subprocess
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+HOSTS = ["controller-0", "controller-1", "controller-2"]
+DEST_CONF_FILE = "/etc/pki/tls/private/overcloud_endpoint.pem"
+DIR_TEMPLATES = "/home/stack/templates"
+ENABLE_SSL_DEFAULT = "/home/stack/templates/enable-tls.yaml"
+ENABLE_SSL_NEW = "/home/stack/script/ssl/enable-tls.yaml"
+FILE_SSL = "overcloud_endpoint.pem"
+PARALLEL = 3
+SSH_TIMEOUT_SEC = 60
+LOCAL_ROOT = "/tmp/ssl-rollout"
+
+FORMAT = '%(asctime)s-%(levelname)s-%(message)s'
+logging.basicConfig(format=FORMAT, level=logging.INFO)
+LOG = logging.getLogger(__name__)
+
+
+class SSHTransport:
+    """Jalankan command di host remote lewat ssh, stdin diteruskan ke command."""
+    sudo = "sudo "
+    owner = "root:root"
+
+    def __init__(self, timeout=SSH_TIMEOUT_SEC):
+        self.timeout = timeout
+
+    def path(self, host, path):
+        return path
+
+    def run(self, host, command, stdin=None):
+        proc = subprocess.run(["ssh", "-o", "BatchMode=yes", host, command],
+                              input=stdin, capture_output=True, timeout=self.timeout)
+        return proc.returncode, proc.stdout.decode(), proc.stderr.decode()
+
+
+class LocalTransport:
+    """
+    Pengganti ssh untuk testing: command dijalankan di mesin lokal tanpa sudo, dan tiap
+    host punya root sendiri (<root>/<host>/...) supaya rollout paralel tidak saling timpa.
+    """
+    sudo = ""
+    owner = None
+
+    def __init__(self, root=LOCAL_ROOT):
+        self.root = root
+
+    def path(self, host, path):
+        local = os.path.join(self.root, host, path.lstrip(os.sep))
+        os.makedirs(os.path.dirname(local), exist_ok=True)
+        return local
+
+    def run(self, host, command, stdin=None):
+        proc = subprocess.run(["sh", "-c", command], input=stdin, capture_output=True)
+        return proc.returncode, proc.stdout.decode(), proc.stderr.decode()
+
+
+def sha256_of(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def remote_fingerprint(transport, host, dest):
+    cmd = f"{transport.sudo}sha256sum {shlex.quote(dest)} 2>/dev/null || true"
+    rc, out, err = transport.run(host, cmd)
+    if rc != 0:
+        raise RuntimeError(f"fingerprint failed: {err.strip()}")
+    return out.split()[0] if out.strip() else None
+
+
+def build_update_command(sudo, owner, dest, backup):
+    """
+    Satu operasi remote: backup sertifikat lama (tanpa menimpa backup yang sudah ada), tulis
+    sertifikat baru dari stdin ke file sementara, set owner/permission lalu mv atomik ke
+    tujuan, dan cetak fingerprint akhir. File sementara berisi private key, jadi selalu
+    dihapus lewat trap EXIT bila salah satu langkah gagal.
+    """
+    dest_q = shlex.quote(dest)
+    backup_q = shlex.quote(backup)
+    tmp_template = shlex.quote(os.path.join(os.path.dirname(dest), f".{os.path.basename(dest)}.XXXXXX"))
+    tmp_q = '"$tmp"'
+    steps = [
+        "tmp=",
+        f"trap '{sudo}rm -f \"$tmp\"' EXIT",
+        f"if {sudo}test -f {dest_q} && ! {sudo}test -e {backup_q}; then {sudo}cp -p {dest_q} {backup_q}; fi",
+        f"tmp=$({sudo}mktemp {tmp_template})",
+        f"{sudo}tee {tmp_q} >/dev/null",
+        f"if {sudo}test -f {dest_q}; then {sudo}chmod --reference={dest_q} {tmp_q}; fi",
+    ]
+    if owner:
+        steps.append(f"{sudo}chown {owner} {tmp_q}")
+    steps += [
+        f"{sudo}mv -f {tmp_q} {dest_q}",
+        f"{sudo}sha256sum {dest_q}",
+    ]
+    return " && ".join(steps)
+
+
+def update_host(transport, host, cert, dest, date, force=False):
+    """Return status host: 'unchanged', 'updated' atau raise bila gagal."""
+    expected = sha256_of(cert)
+    dest = transport.path(host, dest)
+    if not force and remote_fingerprint(transport, host, dest) == expected:
+        LOG.info(f"[{host}] certificate already up to date, skip")
+        return "unchanged"
+
+    root, ext = os.path.splitext(dest)
+    backup = f"{root}-{date}{ext}"
+    command = build_update_command(transport.sudo, transport.owner, dest, backup)
+    rc, out, err = transport.run(host, command, stdin=cert)
+    if rc != 0:
+        raise RuntimeError(f"update failed (rc={rc}): {err.strip()}")
+    if not out.strip() or out.split()[0] != expected:
+        raise RuntimeError("fingerprint mismatch after update")
+    LOG.info(f"[{host}] certificate updated, backup {backup}")
+    return "updated"
+
+
+def rollout(transport, hosts, cert, dest, date, parallel=PARALLEL, force=False):
+    """Update semua host secara paralel. Return dict host -> status ('failed: ...' bila error)."""
+    def worker(host):
+        try:
+            return host, update_host(transport, host, cert, dest, date, force)
+        except (RuntimeError, OSError, subprocess.TimeoutExpired) as e:
+            # OSError: mis. binary ssh tidak ada, cukup host ini yang gagal
+            LOG.error(f"[{host}] {e}")
+            return host, f"failed: {e}"
+
+    with ThreadPoolExecutor(max_workers=max(parallel, 1)) as executor:
+        return dict(executor.map(worker, hosts))
+
+
+def update_enable_tls(enable_ssl_new, enable_ssl_default, dir_templates, date):
+    """Backup dan ganti enable-tls.yaml sekali saja, hanya bila isinya berubah."""
+    if not os.path.exists(enable_ssl_new):
+        LOG.error(f"{enable_ssl_new} not found, {enable_ssl_default} not changed")
+        return False
+    if os.path.exists(enable_ssl_default) and filecmp.cmp(enable_ssl_new, enable_ssl_default, shallow=False):
+        LOG.info(f"{enable_ssl_default} already up to date, skip")
+        return False
+    if os.path.exists(enable_ssl_default):
+        backup = os.path.join(dir_templates, f"enable-tls-{date}.yaml")
+        shutil.copy2(enable_ssl_default, backup)
+        LOG.info(f"Backup {enable_ssl_default} to {backup}")
+    shutil.copy2(enable_ssl_new, enable_ssl_default)
+    LOG.info(f"Copied {enable_ssl_new} to {enable_ssl_default}")
+    return True
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Update sertifikat SSL overcloud ke semua controller")
+    parser.add_argument("hosts", nargs="*", default=HOSTS)
+    parser.add_argument("--cert", default=FILE_SSL)
+    parser.add_argument("--dest", default=DEST_CONF_FILE)
+    parser.add_argument("--parallel", type=int, default=PARALLEL, help="jumlah host yang diupdate bersamaan")
+    parser.add_argument("--force", action="store_true", help="update walau fingerprint sama")
+    parser.add_argument("--local", action="store_true",
+                        help="jalankan command di lokal (testing) bukan ssh, enable-tls.yaml tidak diubah")
+    parser.add_argument("--local-root", default=LOCAL_ROOT, help="root per host untuk --local: <root>/<host>/<dest>")
+    parser.add_argument("--skip-templates", action="store_true", help="jangan ubah enable-tls.yaml")
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    date = datetime.now().strftime('%Y-%m-%d-%H:%M:%S')
+
+    with open(args.cert, "rb") as f:
+        cert = f.read()
+
+    transport = LocalTransport(args.local_root) if args.local else SSHTransport()
+    results = rollout(transport, args.hosts, cert, args.dest, date, args.parallel, args.force)
+    for host in args.hosts:
+        print(f"{host}: {results[host]}")
+
+    failed = any(status.startswith("failed") for status in results.values())
+    if failed:
+        LOG.error("Some hosts failed, enable-tls.yaml not changed")
+    elif not (args.skip_templates or args.local):
+        update_enable_tls(ENABLE_SSL_NEW, ENABLE_SSL_DEFAULT, DIR_TEMPLATES, date)
+
+    if failed:
+        sys.exit(1)
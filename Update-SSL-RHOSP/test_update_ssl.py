@@ -0,0 +1,87 @@
+import os
+import tempfile
+import unittest
+import importlib.util
+
+# main.py tiap tool di-load dengan nama unik supaya pytest dari root repo tidak bentrok
+_spec = importlib.util.spec_from_file_location("update_ssl_rhosp", os.path.join(os.path.dirname(__file__), "main.py"))
+main = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(main)
+LocalTransport, rollout, sha256_of, update_enable_tls = (
+    main.LocalTransport, main.rollout, main.sha256_of, main.update_enable_tls)
+
+DEST = "/etc/pki/tls/private/overcloud_endpoint.pem"
+HOSTS = ["controller-0", "controller-1", "controller-2"]
+DATE = "2024-01-01-00:00:00"
+
+
+def read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+class RolloutTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.transport = LocalTransport(self.tmp.name)
+        for host in HOSTS:
+            dest = self.transport.path(host, DEST)
+            with open(dest, "wb") as f:
+                f.write(f"old {host}\n".encode())
+            os.chmod(dest, 0o600)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_parallel_hosts_get_own_dest_and_backup(self):
+        results = rollout(self.transport, HOSTS, b"new\n", DEST, DATE, parallel=3)
+        self.assertEqual(results, {host: "updated" for host in HOSTS})
+        for host in HOSTS:
+            dest = self.transport.path(host, DEST)
+            self.assertEqual(read(dest), b"new\n")
+            self.assertEqual(os.stat(dest).st_mode & 0o777, 0o600)
+            backup = dest.replace(".pem", f"-{DATE}.pem")
+            self.assertEqual(read(backup), f"old {host}\n".encode())
+
+    def test_second_run_skips_and_force_keeps_backup(self):
+        rollout(self.transport, HOSTS, b"new\n", DEST, DATE)
+        self.assertEqual(set(rollout(self.transport, HOSTS, b"new\n", DEST, DATE).values()), {"unchanged"})
+
+        results = rollout(self.transport, HOSTS, b"new\n", DEST, DATE, force=True)
+        self.assertEqual(set(results.values()), {"updated"})
+        backup = self.transport.path(HOSTS[0], DEST).replace(".pem", f"-{DATE}.pem")
+        self.assertEqual(read(backup), b"old controller-0\n")
+
+    def test_failed_update_removes_temp_file(self):
+        self.transport.owner = "no-such-user:no-such-group"
+        results = rollout(self.transport, HOSTS[:1], b"new\n", DEST, DATE)
+        self.assertTrue(results[HOSTS[0]].startswith("failed"))
+
+        dest = self.transport.path(HOSTS[0], DEST)
+        self.assertEqual(read(dest), b"old controller-0\n")
+        leftovers = [name for name in os.listdir(os.path.dirname(dest)) if name.startswith(".")]
+        self.assertEqual(leftovers, [])
+        self.assertNotEqual(sha256_of(read(dest)), sha256_of(b"new\n"))
+
+    def test_os_error_fails_only_that_host(self):
+        class MissingSSH(LocalTransport):
+            def run(self, host, command, stdin=None):
+                if host == HOSTS[0]:
+                    raise FileNotFoundError("ssh")
+                return super().run(host, command, stdin)
+
+        results = rollout(MissingSSH(self.tmp.name), HOSTS, b"new\n", DEST, DATE)
+        self.assertTrue(results[HOSTS[0]].startswith("failed"))
+        self.assertEqual([results[host] for host in HOSTS[1:]], ["updated", "updated"])
+
+    def test_enable_tls_missing_source_is_not_fatal(self):
+        default = os.path.join(self.tmp.name, "enable-tls.yaml")
+        with open(default, "w") as f:
+            f.write("old\n")
+        missing = os.path.join(self.tmp.name, "missing.yaml")
+        self.assertFalse(update_enable_tls(missing, default, self.tmp.name, DATE))
+        self.assertEqual(read(default), b"old\n")
+
+
+if __name__ == '__main__':
+    unittest.main()